@@ -1,9 +1,46 @@
 """Changelog management utilities for CHANGELOG.md manipulation."""
 
+import mmap
 import os
 import re
-from datetime import datetime
-from typing import List, Optional, Tuple
+from datetime import date as _date
+from itertools import chain, islice
+from typing import Iterable, List, Optional, Tuple
+
+# Cheap prefix shared by every section header; lines failing this test
+# never reach the regex engine
+_HEADER_PREFIX = "## "
+
+# Pattern to match version headers (## 1.2.3 - 2023-12-25), compiled once
+# at import and shared by every ChangelogManager instance
+_VERSION_HEADER = re.compile(r"^## (\d+\.\d+\.\d+) - (\d{4}-\d{2}-\d{2})$")
+
+# Bytes-mode header patterns used to scan a read-only mmap of the file
+# without decoding or splitting it into per-line strings
+_VERSION_HEADER_SCAN = re.compile(
+    rb"^[ \t]*## (\d+\.\d+\.\d+) - (\d{4}-\d{2}-\d{2})[ \t]*\r?$", re.MULTILINE
+)
+_UNRELEASED_SCAN = re.compile(
+    rb"^[ \t]*## Unreleased[ \t]*\r?$", re.IGNORECASE | re.MULTILINE
+)
+
+# Lowercased Unreleased header; a plain string compare replaces the old
+# case-insensitive regex for this fixed text
+_UNRELEASED_LINE = "## unreleased"
+
+# Strict YYYY-MM-DD shape check; rejects malformed dates without paying
+# for exception construction
+_VALID_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Multiline sweep that finds every section header in one pass over the
+# whole text, so the compiled engine does the scanning instead of a
+# Python-level per-line loop. Leading whitespace is tolerated to match
+# the per-line strip() the old parser applied before comparing headers.
+_HEADER_SCAN = re.compile("^[ \\t]*" + _HEADER_PREFIX + "[^\\n]*", re.MULTILINE)
+
+# Buffer size for changelog file I/O; large enough that a typical
+# changelog is read or written in a single syscall
+_IO_BUFFER_SIZE = 256 * 1024
 
 
 class ChangelogError(Exception):
@@ -15,19 +52,174 @@ class ChangelogError(Exception):
 class ChangelogManager:
     """Manages CHANGELOG.md file operations."""
 
-    # Pattern to match version headers (## 1.2.3 - 2023-12-25)
-    VERSION_HEADER_PATTERN = re.compile(r"^## (\d+\.\d+\.\d+) - (\d{4}-\d{2}-\d{2})$")
-
-    # Pattern to match unreleased header
-    UNRELEASED_PATTERN = re.compile(r"^## Unreleased$", re.IGNORECASE)
-
-    def __init__(self, changelog_path: str = "CHANGELOG.md"):
+    def __init__(
+        self, changelog_path: str = "CHANGELOG.md", *, text: Optional[str] = None
+    ):
         """Initialize ChangelogManager.
 
         Args:
             changelog_path: Path to the CHANGELOG.md file
+            text: Optional initial content. When given, the manager
+                operates on an in-memory buffer and never touches the
+                filesystem; the parsing logic is identical.
         """
         self.changelog_path = changelog_path
+        self._text = text
+        self._in_memory = text is not None
+        self._generation = 0
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """Reset the cached parse state so the next access re-reads the file."""
+        self._cache_stamp: Optional[Tuple[int, int]] = None
+        self._lines: List[str] = []
+        self._unreleased_idx = -1
+        self._version_headers: List[Tuple[int, str, str]] = []
+        self._content_start = -1
+        self._content_end = -1
+        self._trailing_newline = False
+        self._header_scan_cache: Optional[
+            Tuple[Tuple[int, int], bool, List[Tuple[str, str]]]
+        ] = None
+        self._stat_cache: Optional[os.stat_result] = None
+        self._stat_known = False
+
+    def _stat(self) -> Optional[os.stat_result]:
+        """Stat the changelog once and cache the result.
+
+        Returns:
+            os.stat_result for the changelog, or None if it does not exist.
+            Invalidated whenever the manager writes the file.
+        """
+        if not self._stat_known:
+            try:
+                self._stat_cache = os.stat(self.changelog_path)
+            except OSError:
+                self._stat_cache = None
+            self._stat_known = True
+        return self._stat_cache
+
+    def _parse(self) -> None:
+        """Scan the changelog once and cache the section layout.
+
+        Reads the file a single time and records the Unreleased header
+        position, the unreleased content boundaries and every version
+        header in one pass. The cache is keyed on the file's mtime and
+        size, so repeated calls within one command are O(1).
+
+        Raises:
+            ChangelogError: If changelog cannot be read
+        """
+        # _text is the in-memory buffer; checking it directly (rather
+        # than the _in_memory flag) also narrows it for type checking
+        if self._text is not None:
+            # The generation counter plays the role of the mtime stamp
+            stamp: Optional[Tuple[int, int]] = (self._generation, len(self._text))
+        else:
+            stat = self._stat()
+            stamp = (stat.st_mtime_ns, stat.st_size) if stat is not None else None
+
+        if stamp is not None and stamp == self._cache_stamp:
+            return
+
+        content = self.read_changelog()
+        lines = content.splitlines()
+
+        unreleased_idx = -1
+        content_start = -1
+        content_end = -1
+        version_headers: List[Tuple[int, str, str]] = []
+
+        # One multiline sweep finds every header; line indices are then
+        # recovered by counting newlines between consecutive matches only.
+        # Bind the bound methods locally to skip repeated attribute lookups.
+        version_match = _VERSION_HEADER.match
+        count_newlines = content.count
+        pos = 0
+        line_no = 0
+        for header in _HEADER_SCAN.finditer(content):
+            line_no += count_newlines("\n", pos, header.start())
+            pos = header.start()
+            stripped = header.group(0).strip()
+
+            if stripped.lower() == _UNRELEASED_LINE:
+                if unreleased_idx == -1:
+                    unreleased_idx = line_no
+                continue
+
+            match = version_match(stripped)
+            if match:
+                version_headers.append((line_no, match.group(1), match.group(2)))
+
+            # First non-unreleased header after Unreleased ends its content
+            if unreleased_idx != -1 and content_end == -1:
+                content_end = line_no
+
+        if unreleased_idx != -1:
+            if content_end == -1:
+                content_end = len(lines)
+
+            # Content starts at the first non-empty line after the header;
+            # isspace() tests emptiness without allocating a stripped copy
+            for j in range(unreleased_idx + 1, content_end):
+                line = lines[j]
+                if line and not line.isspace():
+                    content_start = j
+                    break
+            else:
+                content_start = content_end
+
+        self._lines = lines
+        self._unreleased_idx = unreleased_idx
+        self._version_headers = version_headers
+        self._content_start = content_start
+        self._content_end = content_end
+        self._trailing_newline = content.endswith("\n")
+        self._cache_stamp = stamp
+
+    def _scan_headers_mmap(self) -> Tuple[bool, List[Tuple[str, str]]]:
+        """Scan section headers from a read-only mmap of the changelog.
+
+        Runs the bytes-mode multiline patterns directly over the mapped
+        file, so header discovery needs no full decode and no per-line
+        string allocation. Only the matched version/date groups are
+        decoded. Used by the read-only scanners when the parse cache is
+        cold. Results are memoized on the file's mtime and size, so the
+        several read-only calls made by one CLI command share one scan.
+
+        Returns:
+            Tuple of (has_unreleased, list of (version, date) pairs)
+
+        Raises:
+            ChangelogError: If changelog cannot be read
+        """
+        try:
+            with open(self.changelog_path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                cached = self._header_scan_cache
+                if cached is not None and cached[0] == stamp:
+                    return cached[1], cached[2]
+
+                if stat.st_size == 0:
+                    has_unreleased, versions = False, []
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        has_unreleased = _UNRELEASED_SCAN.search(mm) is not None
+                        versions = [
+                            (
+                                match.group(1).decode("ascii"),
+                                match.group(2).decode("ascii"),
+                            )
+                            for match in _VERSION_HEADER_SCAN.finditer(mm)
+                        ]
+
+                self._header_scan_cache = (stamp, has_unreleased, versions)
+                return has_unreleased, versions
+        except FileNotFoundError:
+            raise ChangelogError(f"Changelog file '{self.changelog_path}' not found")
+        except Exception as e:
+            raise ChangelogError(f"Failed to read changelog: {e}")
 
     def changelog_exists(self) -> bool:
         """Check if CHANGELOG.md exists.
@@ -35,7 +227,9 @@ class ChangelogManager:
         Returns:
             True if changelog exists, False otherwise
         """
-        return os.path.exists(self.changelog_path)
+        if self._in_memory:
+            return True
+        return self._stat() is not None
 
     def create_initial_changelog(self) -> None:
         """Create an initial CHANGELOG.md file with basic structure."""
@@ -50,8 +244,7 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
 
 """
 
-        with open(self.changelog_path, "w", encoding="utf-8") as f:
-            f.write(initial_content)
+        self.write_changelog(initial_content)
 
     def read_changelog(self) -> str:
         """Read the entire changelog content.
@@ -62,8 +255,12 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         Raises:
             ChangelogError: If changelog cannot be read
         """
+        if self._text is not None:
+            return self._text
         try:
-            with open(self.changelog_path, "r", encoding="utf-8") as f:
+            with open(
+                self.changelog_path, "r", encoding="utf-8", buffering=_IO_BUFFER_SIZE
+            ) as f:
                 return f.read()
         except FileNotFoundError:
             raise ChangelogError(f"Changelog file '{self.changelog_path}' not found")
@@ -73,69 +270,99 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
     def write_changelog(self, content: str) -> None:
         """Write content to changelog file.
 
+        The content is written to a temporary file in the same directory
+        and atomically renamed over the changelog, so a crash mid-write
+        never leaves a truncated CHANGELOG.md behind.
+
         Args:
             content: Content to write
 
         Raises:
             ChangelogError: If changelog cannot be written
         """
+        if self._in_memory:
+            self._text = content
+            self._generation += 1
+            self._invalidate_cache()
+            return
+        tmp_path = self.changelog_path + ".tmp"
         try:
-            with open(self.changelog_path, "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
                 f.write(content)
+            os.replace(tmp_path, self.changelog_path)
         except Exception as e:
+            self._remove_tmp(tmp_path)
             raise ChangelogError(f"Failed to write changelog: {e}")
+        self._invalidate_cache()
 
-    def _find_unreleased_section(self, lines: List[str]) -> Tuple[int, int]:
-        """Find the start and end of the Unreleased section.
+    def _write_lines(self, lines: Iterable[str]) -> None:
+        """Write changelog lines directly, skipping the monolithic join.
+
+        Streams lines from any iterable to a temporary file instead of
+        concatenating the whole changelog into one string first, then
+        atomically renames it over the changelog. The original trailing
+        newline (recorded by the parse cache) is preserved.
 
         Args:
-            lines: List of changelog lines
+            lines: Iterable of changelog lines without line endings
+
+        Raises:
+            ChangelogError: If changelog cannot be written
+        """
+        if self._in_memory:
+            line_list = list(lines)
+            text = "\n".join(line_list)
+            if self._trailing_newline and line_list:
+                text += "\n"
+            self._text = text
+            self._generation += 1
+            self._invalidate_cache()
+            return
+        tmp_path = self.changelog_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+                # Buffer one line so the final line's newline can follow
+                # the trailing-newline policy without knowing the length
+                iterator = iter(lines)
+                prev = next(iterator, None)
+                if prev is not None:
+                    for line in iterator:
+                        f.write(prev)
+                        f.write("\n")
+                        prev = line
+                    f.write(prev)
+                    if self._trailing_newline:
+                        f.write("\n")
+            os.replace(tmp_path, self.changelog_path)
+        except Exception as e:
+            self._remove_tmp(tmp_path)
+            raise ChangelogError(f"Failed to write changelog: {e}")
+        self._invalidate_cache()
+
+    @staticmethod
+    def _remove_tmp(tmp_path: str) -> None:
+        """Best-effort removal of a leftover temporary changelog file."""
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    def _find_unreleased_section(self) -> Tuple[int, int, int]:
+        """Find the Unreleased header and the bounds of its content.
 
         Returns:
-            Tuple of (start_index, end_index) for unreleased content
+            Tuple of (header_index, start_index, end_index) for the
+            unreleased section
 
         Raises:
             ChangelogError: If unreleased section is not found or malformed
         """
-        unreleased_start = -1
-        content_start = -1
-        content_end = -1
+        self._parse()
 
-        for i, line in enumerate(lines):
-            if self.UNRELEASED_PATTERN.match(line.strip()):
-                unreleased_start = i
-                # Look for content start (first non-empty line after header)
-                for j in range(i + 1, len(lines)):
-                    if lines[j].strip():
-                        if lines[j].strip().startswith("##"):
-                            # Next section found, unreleased is empty
-                            content_start = j
-                            content_end = j
-                            break
-                        else:
-                            content_start = j
-                            break
-                else:
-                    # No content found, unreleased section goes to end
-                    content_start = len(lines)
-                    content_end = len(lines)
-                break
-
-        if unreleased_start == -1:
+        if self._unreleased_idx == -1:
             raise ChangelogError("'## Unreleased' section not found in changelog")
 
-        # Find end of unreleased content (next ## header or end of file)
-        if content_start < len(lines):
-            for i in range(content_start, len(lines)):
-                if lines[i].strip().startswith(
-                    "## "
-                ) and not self.UNRELEASED_PATTERN.match(lines[i].strip()):
-                    content_end = i
-                    break
-            else:
-                content_end = len(lines)
-
-        return content_start, content_end
+        return self._unreleased_idx, self._content_start, self._content_end
 
     def extract_unreleased_content(self) -> List[str]:
         """Extract content from the Unreleased section.
@@ -146,16 +373,13 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         Raises:
             ChangelogError: If extraction fails
         """
-        content = self.read_changelog()
-        lines = content.split("\n")
-
-        content_start, content_end = self._find_unreleased_section(lines)
+        _, content_start, content_end = self._find_unreleased_section()
 
         # Extract content between start and end
         unreleased_content = []
         for i in range(content_start, content_end):
-            line = lines[i].rstrip()
-            if line.strip():  # Skip empty lines at the boundaries
+            line = self._lines[i].rstrip()
+            if line:  # Skip empty lines at the boundaries
                 unreleased_content.append(line)
 
         return unreleased_content
@@ -173,58 +397,61 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
             ChangelogError: If operation fails
         """
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            # date.today().isoformat() is the specialized C path; no full
+            # datetime plus strftime round-trip needed
+            date = _date.today().isoformat()
 
-        # Validate date format
+        # Validate date format: cheap shape check first, then the C-level
+        # fromisoformat for calendar validity
+        if not _VALID_DATE.match(date):
+            raise ChangelogError(f"Invalid date format: {date}. Expected YYYY-MM-DD")
         try:
-            datetime.strptime(date, "%Y-%m-%d")
+            _date.fromisoformat(date)
         except ValueError:
             raise ChangelogError(f"Invalid date format: {date}. Expected YYYY-MM-DD")
 
-        content = self.read_changelog()
-        lines = content.split("\n")
-
-        # Find unreleased section
-        unreleased_start = -1
-        for i, line in enumerate(lines):
-            if self.UNRELEASED_PATTERN.match(line.strip()):
-                unreleased_start = i
-                break
-
-        if unreleased_start == -1:
-            raise ChangelogError("'## Unreleased' section not found in changelog")
-
-        # Extract unreleased content
-        content_start, content_end = self._find_unreleased_section(lines)
+        unreleased_start, content_start, content_end = self._find_unreleased_section()
+        lines = self._lines
         unreleased_content = lines[content_start:content_end]
 
-        # Remove empty lines from unreleased content
-        while unreleased_content and not unreleased_content[0].strip():
-            unreleased_content.pop(0)
-        while unreleased_content and not unreleased_content[-1].strip():
-            unreleased_content.pop()
-
-        # Build new changelog content
-        new_lines = []
-
-        # Add everything up to and including the Unreleased header
-        new_lines.extend(lines[: unreleased_start + 1])
-
-        # Add empty line after Unreleased header
-        new_lines.append("")
-
-        # Add new version section
+        # Trim empty boundary lines with one slice instead of O(n) pops
+        first = next(
+            (i for i, line in enumerate(unreleased_content) if line.strip()),
+            len(unreleased_content),
+        )
+        last = next(
+            (
+                i
+                for i in range(len(unreleased_content) - 1, -1, -1)
+                if unreleased_content[i].strip()
+            ),
+            -1,
+        )
+        unreleased_content = unreleased_content[first : last + 1]
+
+        # New version section, preceded by the empty line that follows
+        # the Unreleased header
+        section = [""]
         if unreleased_content:
-            new_lines.append(f"## {version} - {date}")
-            new_lines.append("")
-            new_lines.extend(unreleased_content)
-            new_lines.append("")
-
-        # Add everything after the unreleased content
-        new_lines.extend(lines[content_end:])
-
-        # Write updated changelog
-        self.write_changelog("\n".join(new_lines))
+            section.append(f"## {version} - {date}")
+            section.append("")
+            section.extend(unreleased_content)
+            # The blank line separates the section from following
+            # content; at end-of-file the trailing-newline policy
+            # already terminates the last line, and keeping it would
+            # add a spurious blank line
+            if content_end < len(lines):
+                section.append("")
+
+        # Stream head, new section and tail straight to the file without
+        # materializing the combined line list
+        self._write_lines(
+            chain(
+                islice(lines, unreleased_start + 1),
+                section,
+                islice(lines, content_end, None),
+            )
+        )
 
     def has_unreleased_content(self) -> bool:
         """Check if there is content in the Unreleased section.
@@ -233,28 +460,30 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
             True if unreleased section has content, False otherwise
         """
         try:
-            unreleased_content = self.extract_unreleased_content()
-            return len(unreleased_content) > 0
+            self._parse()
         except ChangelogError:
             return False
 
+        if self._unreleased_idx == -1:
+            return False
+
+        # The cached content bounds start at the first non-empty line, so
+        # a non-empty range means content without extracting any lines
+        return self._content_start < self._content_end
+
     def get_version_sections(self) -> List[Tuple[str, str]]:
         """Get all version sections from the changelog.
 
         Returns:
             List of tuples (version, date) for each version section
         """
-        content = self.read_changelog()
-        lines = content.split("\n")
+        if self._cache_stamp is None and not self._in_memory:
+            # Cold cache: a header-only mmap scan avoids materializing lines
+            _, versions = self._scan_headers_mmap()
+            return versions
 
-        versions = []
-        for line in lines:
-            match = self.VERSION_HEADER_PATTERN.match(line.strip())
-            if match:
-                version, date = match.groups()
-                versions.append((version, date))
-
-        return versions
+        self._parse()
+        return [(version, date) for _, version, date in self._version_headers]
 
     def validate_changelog_format(self) -> List[str]:
         """Validate changelog format and return list of issues.
@@ -269,19 +498,17 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
             return issues
 
         try:
-            content = self.read_changelog()
-            lines = content.split("\n")
+            if self._cache_stamp is None and not self._in_memory:
+                # Cold cache: a header-only mmap scan avoids materializing lines
+                has_unreleased, _ = self._scan_headers_mmap()
+            else:
+                self._parse()
+                has_unreleased = self._unreleased_idx != -1
         except Exception as e:
             issues.append(f"Cannot read changelog: {e}")
             return issues
 
         # Check for Unreleased section
-        has_unreleased = False
-        for line in lines:
-            if self.UNRELEASED_PATTERN.match(line.strip()):
-                has_unreleased = True
-                break
-
         if not has_unreleased:
             issues.append("Missing '## Unreleased' section")
 
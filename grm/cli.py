@@ -1,20 +1,25 @@
 """Main CLI interface for GRM (Git Release Manager)."""
 
-from typing import Optional, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import click
 
-from .git_operations import GitManager, GitOperationError
-from .version_manager import VersionManager
-from .changelog import ChangelogManager, ChangelogError
 from .utils import (
     error_exit,
     success_message,
     warning_message,
     info_message,
     confirm_action,
+    message_batch,
 )
 
+if TYPE_CHECKING:
+    from .changelog import ChangelogManager
+    from .git_operations import GitManager
+    from .version_manager import VersionManager
+
 
 @click.group(invoke_without_command=True)
 @click.pass_context
@@ -84,11 +89,16 @@ def hotfix(bump_type: Optional[str]):
 @cli.command("f")
 def finish():
     """Finish the current release or hotfix."""
+    # Imported here so `grm`/`grm --help` never pay GitPython's import cost
+    from .git_operations import GitManager, GitOperationError
 
     try:
         # Initialize managers
         git_manager = GitManager()
 
+        # One batched ref listing answers the branch/tag queries below
+        git_manager.load_refs_snapshot()
+
         # Validate preconditions
         _validate_finish_preconditions(git_manager)
 
@@ -98,6 +108,10 @@ def finish():
         branch_label = branch_type.capitalize()
         integration_branch = git_manager.get_integration_branch()
 
+        # Probe these once; each call forks a git subprocess
+        has_develop = git_manager.branch_exists("develop")
+        has_remote = git_manager.has_remote()
+
         info_message(f"Finishing {branch_type} {version}...")
 
         # Confirm the action
@@ -110,9 +124,9 @@ def finish():
         # Merge to integration branch (main/master)
         info_message(f"Merging to {integration_branch}...")
         git_manager.checkout_branch(integration_branch)
-        
+
         # Pull latest changes from remote before merging
-        if git_manager.has_remote():
+        if has_remote:
             info_message(f"Pulling latest changes from {integration_branch}...")
             try:
                 git_manager.pull_branch(integration_branch)
@@ -121,7 +135,7 @@ def finish():
                 warning_message(f"Failed to pull latest changes: {e}")
                 if not confirm_action("Continue with merge anyway?", default=False):
                     error_exit(f"{branch_label} finish cancelled.")
-        
+
         git_manager.merge_branch(current_branch, commit_message, no_ff=True)
 
         # Create tag
@@ -129,12 +143,12 @@ def finish():
         git_manager.create_tag(version)
 
         # Merge back to develop if it exists
-        if git_manager.branch_exists("develop"):
+        if has_develop:
             info_message("Merging back to develop...")
             git_manager.checkout_branch("develop")
-            
+
             # Pull latest changes from remote before merging
-            if git_manager.has_remote():
+            if has_remote:
                 info_message(f"Pulling latest changes from develop...")
                 try:
                     git_manager.pull_branch("develop")
@@ -143,7 +157,7 @@ def finish():
                     warning_message(f"Failed to pull latest changes from develop: {e}")
                     if not confirm_action("Continue with merge anyway?", default=False):
                         error_exit(f"{branch_label} finish cancelled.")
-            
+
             git_manager.merge_branch(integration_branch, commit_message, no_ff=True)
         else:
             warning_message("No 'develop' branch found, skipping merge back")
@@ -151,7 +165,6 @@ def finish():
         # Delete current version branch (local and remote)
         info_message(f"Deleting {branch_type} branch {current_branch}...")
         try:
-            has_remote = git_manager.has_remote()
             git_manager.delete_branch(
                 current_branch, force=False, delete_remote=has_remote
             )
@@ -170,30 +183,29 @@ def finish():
             else:
                 raise
 
-        success_message(f"✓ {branch_label} {version} finished successfully!")
-        info_message("Summary:")
-        info_message(f"  • Merged {current_branch} to {integration_branch}")
-        info_message(f"  • Created tag {version}")
-        if git_manager.branch_exists("develop"):
-            info_message(f"  • Merged {integration_branch} back to develop")
-        info_message(f"  • Deleted {branch_type} branch")
+        # One buffered write for the whole summary block
+        with message_batch() as batch:
+            batch.success(f"✓ {branch_label} {version} finished successfully!")
+            batch.info("Summary:")
+            batch.info(f"  • Merged {current_branch} to {integration_branch}")
+            batch.info(f"  • Created tag {version}")
+            if has_develop:
+                batch.info(f"  • Merged {integration_branch} back to develop")
+            batch.info(f"  • Deleted {branch_type} branch")
 
         # Push changes to remote if remote exists
-        has_remote = git_manager.has_remote()
         if has_remote:
             info_message("Pushing changes to remote...")
             try:
-                # Push integration branch
-                git_manager.push_branch(integration_branch)
-                info_message(f"✓ Pushed {integration_branch}")
+                # One push carries all refs: single connection, single pack
+                refspecs = [integration_branch, "refs/tags/*:refs/tags/*"]
+                if has_develop:
+                    refspecs.append("develop")
+                git_manager.push_refspecs(refspecs)
 
-                # Push tag
-                git_manager.repo.git.push("origin", "--tags")
+                info_message(f"✓ Pushed {integration_branch}")
                 info_message(f"✓ Pushed tag {version}")
-
-                # Push develop if it exists
-                if git_manager.branch_exists("develop"):
-                    git_manager.push_branch("develop")
+                if has_develop:
                     info_message("✓ Pushed develop")
 
             except GitOperationError as e:
@@ -201,7 +213,7 @@ def finish():
                 warning_message("You may need to push manually")
 
         # Switch to develop branch if it exists, otherwise stay on integration branch
-        if git_manager.branch_exists("develop"):
+        if has_develop:
             git_manager.checkout_branch("develop")
             info_message("✓ Switched to develop branch")
         else:
@@ -216,12 +228,19 @@ def finish():
 
 def _start_version_branch(branch_type: str, bump_type: Optional[str]):
     """Create a new version branch using the shared release flow."""
+    # Imported here so `grm`/`grm --help` never pay GitPython's import cost
+    from .changelog import ChangelogManager, ChangelogError
+    from .git_operations import GitManager, GitOperationError
+    from .version_manager import VersionManager
 
     try:
         git_manager = GitManager()
         changelog_manager = ChangelogManager()
         branch_label = branch_type.capitalize()
 
+        # One batched ref listing answers the branch/tag queries below
+        git_manager.load_refs_snapshot()
+
         _validate_version_branch_preconditions(
             git_manager, changelog_manager, branch_type
         )
@@ -234,7 +253,10 @@ def _start_version_branch(branch_type: str, bump_type: Optional[str]):
             if changelog_versions and len(changelog_versions) > 0:
                 latest_changelog_version = changelog_versions[0][0]
                 latest_tag_version = version_manager.get_latest_version()
-                if latest_tag_version and str(latest_tag_version) != latest_changelog_version:
+                if (
+                    latest_tag_version
+                    and str(latest_tag_version) != latest_changelog_version
+                ):
                     error_exit(
                         f"Version mismatch: CHANGELOG.md has {latest_changelog_version}, "
                         f"but latest git tag is {latest_tag_version}"
@@ -246,17 +268,18 @@ def _start_version_branch(branch_type: str, bump_type: Optional[str]):
             bump_type = _prompt_for_bump_type(version_manager)
 
         new_version = version_manager.suggest_version(bump_type)
+        version_str = str(new_version)
 
-        if not confirm_action(f"Create {branch_type} {new_version}?", default=True):
+        if not confirm_action(f"Create {branch_type} {version_str}?", default=True):
             info_message(f"{branch_label} creation cancelled.")
             return
 
-        branch_name = f"{branch_type}/{new_version}"
+        branch_name = f"{branch_type}/{version_str}"
         info_message(f"Creating {branch_type} branch: {branch_name}")
         git_manager.create_branch(branch_name, checkout=True)
 
         info_message("Updating CHANGELOG.md...")
-        changelog_manager.move_unreleased_to_version(str(new_version))
+        changelog_manager.move_unreleased_to_version(version_str)
 
         info_message("Committing changelog changes...")
         git_manager.commit_changes("Changelog", files=["CHANGELOG.md"])
@@ -270,10 +293,14 @@ def _start_version_branch(branch_type: str, bump_type: Optional[str]):
                 warning_message(f"Failed to push {branch_type} branch: {e}")
                 warning_message("You may need to push manually")
 
-        success_message(f"✓ {branch_label} branch '{branch_name}' created successfully!")
-        info_message("Next steps:")
-        info_message("  1. Review the changes in CHANGELOG.md")
-        info_message("  2. When ready, run: grm f")
+        # One buffered write for the whole next-steps block
+        with message_batch() as batch:
+            batch.success(
+                f"✓ {branch_label} branch '{branch_name}' created successfully!"
+            )
+            batch.info("Next steps:")
+            batch.info("  1. Review the changes in CHANGELOG.md")
+            batch.info("  2. When ready, run: grm f")
 
     except (GitOperationError, ChangelogError, ValueError) as e:
         error_exit(str(e))
@@ -285,6 +312,8 @@ def _validate_version_branch_preconditions(
     git_manager: GitManager, changelog_manager: ChangelogManager, branch_type: str
 ):
     """Validate preconditions for creating a version branch."""
+    from .git_operations import GitOperationError
+
     branch_label = branch_type.capitalize()
 
     # Check for uncommitted changes
@@ -293,6 +322,8 @@ def _validate_version_branch_preconditions(
             "Working directory has uncommitted changes. Please commit or stash them first."
         )
 
+    has_remote = git_manager.has_remote()
+
     # Ensure we're on the correct branch for creating releases
     release_source_branch = git_manager.get_release_source_branch()
     current_branch = git_manager.get_current_branch_name()
@@ -304,13 +335,16 @@ def _validate_version_branch_preconditions(
             warning_message(
                 f"Currently on '{current_branch}' branch, but {branch_type} branches must be created from '{release_source_branch}'."
             )
-            if confirm_action(f"Switch to '{release_source_branch}' branch and continue?", default=True):
+            if confirm_action(
+                f"Switch to '{release_source_branch}' branch and continue?",
+                default=True,
+            ):
                 info_message(f"Checking out '{release_source_branch}' branch...")
                 git_manager.checkout_branch(release_source_branch)
                 success_message(f"✓ Switched to '{release_source_branch}' branch")
-                
+
                 # Pull latest changes if remote exists
-                if git_manager.has_remote():
+                if has_remote:
                     info_message(f"Pulling latest changes from remote...")
                     try:
                         git_manager.pull_branch(release_source_branch)
@@ -340,8 +374,7 @@ def _validate_version_branch_preconditions(
         error_exit("CHANGELOG.md format issues:\n  • " + "\n  • ".join(issues))
 
     existing_branches = git_manager.get_version_branch_names(
-        branch_type,
-        fetch_remote=git_manager.has_remote()
+        branch_type, fetch_remote=has_remote
     )
     if existing_branches:
         error_exit(
@@ -392,6 +425,21 @@ def _parse_version_branch(branch_name: str) -> Tuple[str, str]:
     return branch_type, branch_name[len(branch_type) + 1 :]
 
 
+class _BumpChoice(click.Choice):
+    """Choice that lowercases replies while keeping 'M' distinct from 'm'.
+
+    Full words are case-insensitive ('Patch', 'MAJOR'), matching the old
+    normalization; the bare 'M' shorthand must stay case-sensitive
+    because it means major while 'm' means minor.
+    """
+
+    def convert(self, value, param, ctx):
+        value = value.strip()
+        if value != "M":
+            value = value.lower()
+        return super().convert(value, param, ctx)
+
+
 def _prompt_for_bump_type(version_manager: VersionManager) -> str:
     """Prompt user for version bump type."""
 
@@ -412,16 +460,20 @@ def _prompt_for_bump_type(version_manager: VersionManager) -> str:
     click.echo(f"  [p]atch → {next_patch}")
     click.echo(f"  [M]ajor → {next_major}")
 
-    while True:
-        choice = click.prompt("(minor default)", type=str, default="m", show_default=False).strip()
-        if choice in ["M"] or choice.lower() == "major":
-            return "major"
-        elif choice.lower() in ["p", "patch"]:
-            return "patch"
-        elif choice.lower() in ["m", "minor", ""]:
-            return "minor"
-        else:
-            click.echo("Please enter 'm' for minor, 'p' for patch, or 'M' for major.")
+    # click.Choice validates and re-prompts internally; _BumpChoice
+    # normalizes case first so only 'M' vs 'm' is case-sensitive
+    choice = click.prompt(
+        "(minor default)",
+        type=_BumpChoice(["m", "minor", "p", "patch", "M", "major"]),
+        default="m",
+        show_default=False,
+        show_choices=False,
+    )
+    if choice == "M" or choice.lower() == "major":
+        return "major"
+    if choice.lower() in ("p", "patch"):
+        return "patch"
+    return "minor"
 
 
 def main():
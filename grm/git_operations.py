@@ -1,10 +1,21 @@
 """Git operations wrapper for GRM."""
 
 import os
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from types import ModuleType
+from typing import FrozenSet, List, Optional, Set, Tuple
 import git
 from git import Repo, InvalidGitRepositoryError
 
+pygit2: Optional[ModuleType]
+try:
+    # Optional libgit2 bindings: in-process ref updates instead of one
+    # forked git subprocess per operation
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 
 class GitOperationError(Exception):
     """Exception raised for Git operation errors."""
@@ -12,6 +23,17 @@ class GitOperationError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class RepoState:
+    """Frozen view of repository state captured with one ref listing."""
+
+    local_branches: FrozenSet[str]
+    remote_branches: FrozenSet[str]
+    tags: FrozenSet[str]
+    has_remote: bool
+    current_branch: str
+
+
 class GitManager:
     """Manages Git operations for release management."""
 
@@ -25,9 +47,102 @@ class GitManager:
             GitOperationError: If the path is not a valid Git repository
         """
         try:
-            self.repo = Repo(repo_path, search_parent_directories=True)
+            # GitCmdObjectDB streams object reads through persistent
+            # git-cat-file processes, much faster than the pure-Python odb
+            self.repo = Repo(
+                repo_path, odbt=git.GitCmdObjectDB, search_parent_directories=True
+            )
         except InvalidGitRepositoryError:
             raise GitOperationError(f"'{repo_path}' is not a valid Git repository")
+        self._refs_snapshot: Optional[Tuple[List[str], List[str], List[str]]] = None
+        self._branch_cache: Optional[Set[str]] = None
+        self._libgit_repo = None
+        if pygit2 is not None:
+            try:
+                self._libgit_repo = pygit2.Repository(str(self.repo.git_dir))
+            except Exception:
+                # Fall back to subprocess git if libgit2 cannot open the repo
+                self._libgit_repo = None
+
+    def load_refs_snapshot(self) -> Tuple[List[str], List[str], List[str]]:
+        """Batch-load branch and tag names with one git invocation.
+
+        Runs a single `git for-each-ref` over heads and tags and caches
+        the result, so subsequent branch_exists/get_all_tags queries are
+        dictionary lookups instead of separate ref enumerations. The
+        snapshot is dropped whenever this manager mutates refs.
+
+        Returns:
+            Tuple of (branches, tags, remote branches)
+
+        Raises:
+            GitOperationError: If refs cannot be listed
+        """
+        try:
+            output = self.repo.git.for_each_ref(
+                "refs/heads", "refs/tags", "refs/remotes", format="%(refname)"
+            )
+        except Exception as e:
+            raise GitOperationError(f"Failed to list refs: {e}")
+
+        branches = []
+        tags = []
+        remote_branches = []
+        for refname in output.splitlines():
+            if refname.startswith("refs/heads/"):
+                branches.append(refname[len("refs/heads/") :])
+            elif refname.startswith("refs/tags/"):
+                tags.append(refname[len("refs/tags/") :])
+            elif refname.startswith("refs/remotes/"):
+                remote_branches.append(refname[len("refs/remotes/") :])
+
+        self._refs_snapshot = (branches, tags, remote_branches)
+        return self._refs_snapshot
+
+    def snapshot_repo_state(self) -> RepoState:
+        """Capture branch, tag and remote state with one git invocation.
+
+        Loads the batched ref snapshot (also priming the caches consulted
+        by branch_exists/get_all_tags) and returns it as an immutable
+        RepoState for callers that want a point-in-time view.
+
+        Returns:
+            RepoState describing the repository
+
+        Raises:
+            GitOperationError: If refs cannot be listed
+        """
+        branches, tags, remote_branches = self.load_refs_snapshot()
+
+        return RepoState(
+            local_branches=frozenset(branches),
+            remote_branches=frozenset(remote_branches),
+            tags=frozenset(tags),
+            has_remote=self.has_remote(),
+            current_branch=self.get_current_branch_name(),
+        )
+
+    def _drop_refs_snapshot(self) -> None:
+        """Invalidate the cached ref state after a ref mutation."""
+        self._refs_snapshot = None
+        self._branch_cache = None
+
+    def _branches(self) -> Set[str]:
+        """Return the set of local branch names, cached per ref state.
+
+        Populated from the batched ref snapshot when one is loaded,
+        otherwise from a single GitPython ref walk. Invalidated whenever
+        this manager creates, deletes or checks out branches.
+
+        Returns:
+            Set of local branch names
+        """
+        if self._branch_cache is None:
+            if self._refs_snapshot is not None:
+                self._branch_cache = set(self._refs_snapshot[0])
+            else:
+                self._branch_cache = {branch.name for branch in self.repo.branches}
+        return self._branch_cache
 
     def is_working_directory_clean(self) -> bool:
         """Check if working directory has no uncommitted changes.
@@ -46,30 +161,36 @@ class GitManager:
         Raises:
             GitOperationError: If neither main nor master branch exists locally or remotely
         """
-        branches = [branch.name for branch in self.repo.branches]
+        branches = self._branches()
 
         if "main" in branches:
             return "main"
         elif "master" in branches:
             return "master"
-        
+
         # Check remote branches if local branches don't exist
         if self.has_remote():
             try:
                 remote_refs = [ref.name for ref in self.repo.remote().refs]
-                
+
                 if "origin/main" in remote_refs:
                     # Create local tracking branch for origin/main
                     self.repo.git.checkout("-b", "main", "--track", "origin/main")
+                    self._drop_refs_snapshot()
                     return "main"
                 elif "origin/master" in remote_refs:
                     # Create local tracking branch for origin/master
                     self.repo.git.checkout("-b", "master", "--track", "origin/master")
+                    self._drop_refs_snapshot()
                     return "master"
             except Exception as e:
-                raise GitOperationError(f"Failed to create local branch from remote: {e}")
-        
-        raise GitOperationError("Neither 'main' nor 'master' branch found locally or remotely")
+                raise GitOperationError(
+                    f"Failed to create local branch from remote: {e}"
+                )
+
+        raise GitOperationError(
+            "Neither 'main' nor 'master' branch found locally or remotely"
+        )
 
     def get_release_source_branch(self) -> str:
         """Detect the branch from which releases should be created.
@@ -80,24 +201,23 @@ class GitManager:
         Raises:
             GitOperationError: If neither main nor master branch exists locally or remotely
         """
-        branches = [branch.name for branch in self.repo.branches]
-
-        if "develop" in branches:
+        if "develop" in self._branches():
             return "develop"
-        
+
         # Check remote branches for develop
         if self.has_remote():
             try:
                 remote_refs = [ref.name for ref in self.repo.remote().refs]
-                
+
                 if "origin/develop" in remote_refs:
                     # Create local tracking branch for origin/develop
                     self.repo.git.checkout("-b", "develop", "--track", "origin/develop")
+                    self._drop_refs_snapshot()
                     return "develop"
             except Exception:
                 # If we can't create develop from remote, fall back to integration branch
                 pass
-        
+
         return self.get_integration_branch()
 
     def get_release_branch_names(self, fetch_remote: bool = False) -> List[str]:
@@ -111,9 +231,7 @@ class GitManager:
         try:
             branch_prefix = f"{branch_type}/"
             version_branches = {
-                branch.name
-                for branch in self.repo.branches
-                if branch.name.startswith(branch_prefix)
+                name for name in self._branches() if name.startswith(branch_prefix)
             }
 
             if self.has_remote():
@@ -138,7 +256,12 @@ class GitManager:
         Returns:
             List of tag names
         """
-        return [tag.name for tag in self.repo.tags]
+        if self._refs_snapshot is not None:
+            return list(self._refs_snapshot[1])
+        # One subprocess streaming names beats a TagReference object per tag
+        return self.repo.git.for_each_ref(
+            "--format=%(refname:short)", "refs/tags"
+        ).splitlines()
 
     def get_current_branch_name(self) -> str:
         """Get the name of the current branch.
@@ -172,6 +295,7 @@ class GitManager:
                 new_branch.checkout()
         except Exception as e:
             raise GitOperationError(f"Failed to create branch '{branch_name}': {e}")
+        self._drop_refs_snapshot()
 
     def checkout_branch(self, branch_name: str) -> None:
         """Checkout an existing branch.
@@ -186,6 +310,7 @@ class GitManager:
             self.repo.heads[branch_name].checkout()
         except Exception as e:
             raise GitOperationError(f"Failed to checkout branch '{branch_name}': {e}")
+        self._drop_refs_snapshot()
 
     def commit_changes(self, message: str, files: Optional[List[str]] = None) -> None:
         """Commit changes to the repository.
@@ -239,12 +364,49 @@ class GitManager:
             GitOperationError: If tag creation fails
         """
         try:
-            if message:
-                self.repo.create_tag(tag_name, message=message)
-            else:
-                self.repo.create_tag(tag_name)
+            if not self._create_tag_libgit(tag_name, message):
+                if message:
+                    self.repo.create_tag(tag_name, message=message)
+                else:
+                    self.repo.create_tag(tag_name)
         except Exception as e:
             raise GitOperationError(f"Failed to create tag '{tag_name}': {e}")
+        self._drop_refs_snapshot()
+
+    def _create_tag_libgit(self, tag_name: str, message: Optional[str]) -> bool:
+        """Create a tag in-process via libgit2 when available.
+
+        Args:
+            tag_name: Name of the tag
+            message: Optional tag message for annotated tag
+
+        Returns:
+            True if the tag was created, False if the caller should fall
+            back to the subprocess path
+        """
+        repo = self._libgit_repo
+        if repo is None or pygit2 is None:
+            return False
+
+        if f"refs/tags/{tag_name}" in repo.references:
+            raise ValueError(f"tag '{tag_name}' already exists")
+
+        if message:
+            try:
+                signature = repo.default_signature
+            except Exception:
+                # No usable identity configured; let git resolve it
+                return False
+            repo.create_tag(
+                tag_name,
+                repo.head.target,
+                pygit2.enums.ObjectType.COMMIT,
+                signature,
+                message,
+            )
+        else:
+            repo.references.create(f"refs/tags/{tag_name}", repo.head.target)
+        return True
 
     def delete_branch(
         self, branch_name: str, force: bool = False, delete_remote: bool = False
@@ -283,6 +445,8 @@ class GitManager:
 
         except Exception as e:
             raise GitOperationError(f"Failed to delete branch '{branch_name}': {e}")
+        finally:
+            self._drop_refs_snapshot()
 
     def branch_exists(self, branch_name: str) -> bool:
         """Check if a branch exists.
@@ -293,7 +457,14 @@ class GitManager:
         Returns:
             True if branch exists, False otherwise
         """
-        return branch_name in [branch.name for branch in self.repo.branches]
+        if self._branch_cache is not None or self._refs_snapshot is not None:
+            return branch_name in self._branches()
+
+        if self._libgit_repo is not None:
+            return self._libgit_repo.lookup_branch(branch_name) is not None
+
+        # Cold path: resolve just this ref instead of enumerating every head
+        return git.Head(self.repo, f"refs/heads/{branch_name}").is_valid()
 
     def get_branch_commit_count(self, branch_name: str, base_branch: str) -> int:
         """Get number of commits in branch_name that are not in base_branch.
@@ -306,8 +477,11 @@ class GitManager:
             Number of commits ahead
         """
         try:
-            commits = list(self.repo.iter_commits(f"{base_branch}..{branch_name}"))
-            return len(commits)
+            # rev-list --count returns the number directly, without
+            # materializing a Commit object per revision
+            return int(
+                self.repo.git.rev_list("--count", f"{base_branch}..{branch_name}")
+            )
         except Exception:
             return 0
 
@@ -334,6 +508,53 @@ class GitManager:
         except Exception as e:
             raise GitOperationError(f"Failed to push branch '{branch_name}': {e}")
 
+    def push_refspecs(self, refspecs: List[str]) -> None:
+        """Push several refs to origin with a single git invocation.
+
+        One push shares the connection, ref advertisement and pack for
+        all refs instead of paying those costs per branch/tag.
+
+        Args:
+            refspecs: Refspecs to push (e.g. branch names, 'refs/tags/*:refs/tags/*')
+
+        Raises:
+            GitOperationError: If the push fails
+        """
+        try:
+            self.repo.git.push("origin", *refspecs)
+        except Exception as e:
+            raise GitOperationError(f"Failed to push {', '.join(refspecs)}: {e}")
+
+    def push_many(self, refs: List[str]) -> None:
+        """Push several refs to origin concurrently.
+
+        Each push runs in its own git subprocess and is network-bound,
+        so independent refs can go out in parallel. Prefer
+        push_refspecs() when one push can carry all refs; this helper
+        covers pushes that must stay separate (e.g. different remotes
+        in the future).
+
+        Args:
+            refs: Branch names to push
+
+        Raises:
+            GitOperationError: If any push fails; failures are aggregated
+        """
+        if not refs:
+            return
+
+        errors: List[str] = []
+        with ThreadPoolExecutor(max_workers=min(4, len(refs))) as executor:
+            futures = [executor.submit(self.push_branch, ref) for ref in refs]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except GitOperationError as e:
+                    errors.append(str(e))
+
+        if errors:
+            raise GitOperationError("; ".join(errors))
+
     def pull_branch(self, branch_name: Optional[str] = None) -> None:
         """Pull latest changes from remote for a branch.
 
@@ -350,6 +571,7 @@ class GitManager:
             self.repo.git.pull("origin", branch_name)
         except Exception as e:
             raise GitOperationError(f"Failed to pull branch '{branch_name}': {e}")
+        self._drop_refs_snapshot()
 
     def has_remote(self) -> bool:
         """Check if repository has a remote configured.
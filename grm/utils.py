@@ -1,7 +1,7 @@
 """Utility functions for GRM."""
 
 import sys
-from typing import Any
+from typing import Any, List
 import click
 
 
@@ -43,6 +43,51 @@ def info_message(message: str) -> None:
     click.echo(click.style(message, fg="bright_cyan"))
 
 
+class MessageBuffer:
+    """Collects styled messages and emits them with a single write.
+
+    Consecutive progress messages each cost one write syscall through
+    click.echo; buffering a block and joining it once keeps the output
+    identical while writing it in one call.
+    """
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+
+    def success(self, message: str) -> None:
+        """Buffer a success message in green."""
+        self._lines.append(click.style(message, fg="green"))
+
+    def warning(self, message: str) -> None:
+        """Buffer a warning message in yellow."""
+        self._lines.append(click.style(f"Warning: {message}", fg="yellow"))
+
+    def info(self, message: str) -> None:
+        """Buffer an info message in bright cyan."""
+        self._lines.append(click.style(message, fg="bright_cyan"))
+
+    def flush(self) -> None:
+        """Emit all buffered messages with one click.echo."""
+        if self._lines:
+            click.echo("\n".join(self._lines))
+            self._lines = []
+
+    def __enter__(self) -> "MessageBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+
+def message_batch() -> MessageBuffer:
+    """Create a MessageBuffer for use as a context manager.
+
+    Returns:
+        MessageBuffer that flushes on exit
+    """
+    return MessageBuffer()
+
+
 def confirm_action(message: str, default: bool = False) -> bool:
     """Ask user for confirmation.
 
@@ -1,34 +1,25 @@
 """Version management utilities for SemVer handling."""
 
 import re
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, List, NamedTuple, Optional, Tuple
 
 
-@dataclass
-class Version:
-    """Represents a semantic version."""
+class Version(NamedTuple):
+    """Represents a semantic version.
+
+    A named tuple: comparison, equality and hashing are the C-level
+    tuple slots over (major, minor, patch) in declaration order, with
+    no per-attribute Python dispatch.
+    """
 
     major: int
     minor: int
     patch: int
 
     def __str__(self) -> str:
-        return f"{self.major}.{self.minor}.{self.patch}"
-
-    def __lt__(self, other: "Version") -> bool:
-        return (self.major, self.minor, self.patch) < (
-            other.major,
-            other.minor,
-            other.patch,
-        )
-
-    def __eq__(self, other: "Version") -> bool:
-        return (self.major, self.minor, self.patch) == (
-            other.major,
-            other.minor,
-            other.patch,
-        )
+        # One C-level %-format over the tuple itself
+        return "%d.%d.%d" % self
 
     def bump_major(self) -> "Version":
         """Return a new version with major version bumped and minor/patch reset to 0."""
@@ -43,11 +34,54 @@ class Version:
         return Version(self.major, self.minor, self.patch + 1)
 
 
+# Tag pattern: optional prefix ('v', 'version-', 'release-') fused with
+# the semver match, so each tag costs one C-level regex match. A module
+# binding so the memoized parser needs no class lookup at call time.
+_TAG_PATTERN = re.compile(r"^(?:version-|release-|v)?(\d+)\.(\d+)\.(\d+)$")
+
+# The same pattern in multiline form, for scanning all tags joined into
+# one newline-separated blob with a single findall call. Tag names can
+# never contain newlines, so the line anchors keep per-tag semantics.
+_TAG_BLOB_PATTERN = re.compile(
+    r"^(?:version-|release-|v)?(\d+)\.(\d+)\.(\d+)$", re.MULTILINE
+)
+
+# Plain MAJOR.MINOR.PATCH, compiled once at module load
+_SEMVER_PATTERN = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+
+
+@lru_cache(maxsize=2048)
+def _parse_version_string(version_string: str) -> Optional[Version]:
+    """Parse a semver string into a Version, memoized per string.
+
+    The CLI parses the same handful of strings repeatedly (changelog
+    headers, branch names, user input); warm calls are one dict lookup,
+    and cold calls split with str.partition instead of running the
+    regex engine. isdecimal matches exactly the digits int() accepts,
+    so acceptance is identical to the anchored semver pattern.
+    """
+    major, _, rest = version_string.partition(".")
+    minor, _, patch = rest.partition(".")
+    if major.isdecimal() and minor.isdecimal() and patch.isdecimal():
+        return Version(int(major), int(minor), int(patch))
+    return None
+
+
 class VersionManager:
     """Manages semantic versioning for releases."""
 
     # Regex pattern for semantic versioning (MAJOR.MINOR.PATCH)
-    SEMVER_PATTERN = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+    SEMVER_PATTERN = _SEMVER_PATTERN
+
+    TAG_PATTERN = _TAG_PATTERN
+
+    # Dispatch table for suggest_version: one dict lookup instead of an
+    # if/elif chain of string comparisons
+    _BUMP_DISPATCH = {
+        "major": "get_next_major_version",
+        "minor": "get_next_minor_version",
+        "patch": "get_next_patch_version",
+    }
 
     def __init__(self, tags: List[str]):
         """Initialize VersionManager with existing tags.
@@ -56,41 +90,87 @@ class VersionManager:
             tags: List of tag names from the repository
         """
         self.tags = tags
-        self._versions = self._parse_versions()
+        self._versions_cache: Optional[List[Version]] = None
+        self._version_set_cache: Optional[FrozenSet[Version]] = None
+        self._latest_cache: Optional[Version] = None
+        self._latest_known = False
+        self._next_versions_cache: Optional[Tuple[Version, Version, Version]] = None
+        self._sorted_cache: Optional[Tuple[Version, ...]] = None
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _parse_tag_tuple(tags: Tuple[str, ...]) -> Tuple[Version, ...]:
+        """Parse semantic versions from tags, memoized per tag tuple.
 
-    def _parse_versions(self) -> List[Version]:
-        """Parse semantic versions from tags.
+        Args:
+            tags: Immutable tuple of tag names
 
         Returns:
-            List of Version objects sorted in ascending order
+            Tuple of Version objects in tag order
         """
-        versions = []
+        # One C-level scan over the joined blob instead of N re.match
+        # calls, each paying its own engine setup; map batches the int
+        # conversions through a single C iterator per triple
+        return tuple(
+            Version(*map(int, triple))
+            for triple in _TAG_BLOB_PATTERN.findall("\n".join(tags))
+        )
 
-        for tag in self.tags:
-            # Remove common prefixes like 'v', 'version-', 'release-'
-            # Sort by length to check longer prefixes first
-            clean_tag = tag
-            for prefix in sorted(["v", "version-", "release-"], key=len, reverse=True):
-                if tag.startswith(prefix):
-                    clean_tag = tag[len(prefix) :]
-                    break
+    @property
+    def _versions(self) -> List[Version]:
+        """Parsed versions, computed lazily on first use.
 
-            match = self.SEMVER_PATTERN.match(clean_tag)
-            if match:
-                major, minor, patch = map(int, match.groups())
-                versions.append(Version(major, minor, patch))
+        Construction stays free for callers that never query versions,
+        and managers rebuilt over the same tag list reuse the memoized
+        parse instead of rematching every tag.
+        """
+        if self._versions_cache is None:
+            self._versions_cache = list(self._parse_tag_tuple(tuple(self.tags)))
+        return self._versions_cache
 
-        return sorted(versions)
+    @property
+    def _version_set(self) -> FrozenSet[Version]:
+        """Frozenset over the parsed versions for O(1) membership tests."""
+        if self._version_set_cache is None:
+            self._version_set_cache = frozenset(self._versions)
+        return self._version_set_cache
 
     def get_latest_version(self) -> Optional[Version]:
         """Get the latest semantic version.
 
+        A running max over the parsed versions (computed once) instead
+        of sorting the whole list just to read its last element.
+
         Returns:
             Latest Version object or None if no versions found
         """
-        if not self._versions:
-            return None
-        return self._versions[-1]
+        if not self._latest_known:
+            self._latest_cache = max(self._versions, default=None)
+            self._latest_known = True
+        return self._latest_cache
+
+    @property
+    def _next_versions(self) -> Tuple[Version, Version, Version]:
+        """(next major, minor, patch), derived once from the latest version.
+
+        The summary path asks for several bumps in one render; all
+        three come from a single cached tuple.
+        """
+        if self._next_versions_cache is None:
+            latest = self.get_latest_version()
+            if latest is None:
+                self._next_versions_cache = (
+                    Version(1, 0, 0),
+                    Version(0, 1, 0),
+                    Version(0, 0, 1),
+                )
+            else:
+                self._next_versions_cache = (
+                    latest.bump_major(),
+                    latest.bump_minor(),
+                    latest.bump_patch(),
+                )
+        return self._next_versions_cache
 
     def get_next_minor_version(self) -> Version:
         """Get the next minor version.
@@ -98,10 +178,7 @@ class VersionManager:
         Returns:
             Next minor version (e.g., 1.2.3 -> 1.3.0)
         """
-        latest = self.get_latest_version()
-        if latest is None:
-            return Version(0, 1, 0)
-        return latest.bump_minor()
+        return self._next_versions[1]
 
     def get_next_patch_version(self) -> Version:
         """Get the next patch version.
@@ -109,10 +186,7 @@ class VersionManager:
         Returns:
             Next patch version (e.g., 1.2.3 -> 1.2.4)
         """
-        latest = self.get_latest_version()
-        if latest is None:
-            return Version(0, 0, 1)
-        return latest.bump_patch()
+        return self._next_versions[2]
 
     def get_next_major_version(self) -> Version:
         """Get the next major version.
@@ -120,10 +194,7 @@ class VersionManager:
         Returns:
             Next major version (e.g., 1.2.3 -> 2.0.0)
         """
-        latest = self.get_latest_version()
-        if latest is None:
-            return Version(1, 0, 0)
-        return latest.bump_major()
+        return self._next_versions[0]
 
     def version_exists(self, version: Version) -> bool:
         """Check if a version already exists.
@@ -134,26 +205,37 @@ class VersionManager:
         Returns:
             True if version exists, False otherwise
         """
-        return version in self._versions
+        return version in self._version_set
 
-    def get_all_versions(self) -> List[Version]:
+    def get_all_versions(self) -> Tuple[Version, ...]:
         """Get all parsed versions sorted in ascending order.
 
+        Sorting happens lazily on first call and the result is an
+        immutable cached tuple, so repeat calls return the same view
+        with no defensive copy.
+
         Returns:
-            List of Version objects
+            Tuple of Version objects
         """
-        return self._versions.copy()
+        if self._sorted_cache is None:
+            self._sorted_cache = tuple(sorted(self._versions))
+        return self._sorted_cache
 
     def is_valid_semver(self, version_string: str) -> bool:
         """Check if a string is a valid semantic version.
 
+        String methods instead of the regex engine: split plus three
+        str.isdigit checks, all C-level, with no match-object
+        allocation for this called-per-tag validation.
+
         Args:
             version_string: String to validate
 
         Returns:
             True if valid semantic version, False otherwise
         """
-        return bool(self.SEMVER_PATTERN.match(version_string))
+        parts = version_string.split(".")
+        return len(parts) == 3 and all(part.isdigit() for part in parts)
 
     def parse_version_string(self, version_string: str) -> Optional[Version]:
         """Parse a version string into a Version object.
@@ -164,11 +246,7 @@ class VersionManager:
         Returns:
             Version object or None if parsing fails
         """
-        match = self.SEMVER_PATTERN.match(version_string)
-        if match:
-            major, minor, patch = map(int, match.groups())
-            return Version(major, minor, patch)
-        return None
+        return _parse_version_string(version_string)
 
     def suggest_version(self, bump_type: str) -> Version:
         """Suggest next version based on bump type.
@@ -182,16 +260,12 @@ class VersionManager:
         Raises:
             ValueError: If bump_type is not valid
         """
-        if bump_type == "major":
-            return self.get_next_major_version()
-        elif bump_type == "minor":
-            return self.get_next_minor_version()
-        elif bump_type == "patch":
-            return self.get_next_patch_version()
-        else:
+        method = self._BUMP_DISPATCH.get(bump_type)
+        if method is None:
             raise ValueError(
                 f"Invalid bump type: {bump_type}. Must be 'major', 'minor', or 'patch'"
             )
+        return getattr(self, method)()
 
     def get_version_summary(self) -> str:
         """Get a summary of version information.
@@ -1,60 +1,295 @@
 """Pytest configuration and shared fixtures."""
 
+from __future__ import annotations
+
 import os
-import tempfile
 import shutil
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
 import pytest
-import git
-from git import Repo
 
-from grm.git_operations import GitManager
+try:
+    # Optional libgit2 bindings: in-process fixture bootstrap instead of
+    # forked git subprocesses
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 from grm.changelog import ChangelogManager
 
+if TYPE_CHECKING:
+    from git import Repo
 
-@pytest.fixture
-def temp_dir() -> Generator[str, None, None]:
-    """Create a temporary directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    original_cwd = os.getcwd()
+    from grm.git_operations import GitManager
+
+# GitPython is imported lazily inside the git fixtures, so changelog-only
+# test selections never pay its import cost. One identity for all
+# template commits, skipping per-commit ident lookups.
+TEST_USER_NAME = "Test User"
+TEST_USER_EMAIL = "test@example.com"
+
+# Immutable sample content shared by every changelog test; a module
+# constant so no per-test fixture call rebuilds the string
+SAMPLE_CHANGELOG = """# Changelog
+
+All notable changes to this project will be documented in this file.
+
+The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
+and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
+
+## Unreleased
+
+### Added
+- New feature X
+- New feature Y
 
+### Fixed
+- Bug fix Z
+
+## 1.0.0 - 2023-12-01
+
+### Added
+- Initial release
+"""
+
+
+def pytest_configure(config: "pytest.Config") -> None:
+    """Point pytest's temp root at tmpfs when one is available.
+
+    The git fixtures write and fsync many small files; a RAM-backed
+    basetemp turns that into memory traffic. Workers inherit the
+    environment variable, so the redirect also applies under xdist.
+    """
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(shm))
+
+    # Every git subprocess inherits these: skip the git-binary probe on
+    # import, optional lock files, and system/global config reads (a
+    # per-command tax when the host has a large gitconfig). Template
+    # repos carry their own user identity, so no global config is needed.
+    os.environ.setdefault("GIT_PYTHON_REFRESH", "quiet")
+    os.environ.setdefault("GIT_OPTIONAL_LOCKS", "0")
+    os.environ.setdefault("GIT_CONFIG_NOSYSTEM", "1")
+    os.environ.setdefault("GIT_CONFIG_GLOBAL", os.devnull)
+
+
+def pytest_addoption(parser: "pytest.Parser") -> None:
+    """Add a --skip-slow flag for fast local iteration."""
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="skip tests marked slow (multi-prompt CLI flows)",
+    )
+
+
+# Any test pulling in one of these runs against a real repository on
+# disk, which is an order of magnitude slower than the pure-mock tests
+_GIT_FIXTURES = frozenset({"git_repo", "git_manager", "repo_with_tags", "bare_remote"})
+
+
+def pytest_collection_modifyitems(
+    config: "pytest.Config", items: "list[pytest.Item]"
+) -> None:
+    """Auto-mark real-git tests slow; honor --skip-slow.
+
+    Marking by fixture use keeps the fast tier (pytest -m "not slow")
+    maintenance-free: new git-touching tests are tiered automatically.
+    """
+    slow = pytest.mark.slow
+    skip_slow = (
+        pytest.mark.skip(reason="--skip-slow given")
+        if config.getoption("--skip-slow")
+        else None
+    )
+    for item in items:
+        if not _GIT_FIXTURES.isdisjoint(item.fixturenames):
+            item.add_marker(slow)
+        if skip_slow is not None and "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def fastwrite(path: str, text: str) -> None:
+    """Write small text payloads through a raw file descriptor.
+
+    Skips the BufferedWriter/TextIOWrapper pair and exit-time flush that
+    ``with open(path, "w")`` allocates; for the sub-kilobyte files the
+    tests create this is one open/write/close syscall triple.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
     try:
-        os.chdir(temp_dir)
-        yield temp_dir
+        os.write(fd, text.encode())
     finally:
-        os.chdir(original_cwd)
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.close(fd)
 
 
 @pytest.fixture
-def git_repo(temp_dir: str) -> Generator[Repo, None, None]:
-    """Create a temporary Git repository."""
-    repo = Repo.init(temp_dir)
-
-    # Configure user for commits
+def temp_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Change into a per-test temporary directory managed by pytest.
+
+    tmp_path directories are garbage-collected across sessions by
+    pytest itself, so teardown needs no rmtree walk, and
+    monkeypatch.chdir restores the working directory automatically.
+    """
+    monkeypatch.chdir(tmp_path)
+    return str(tmp_path)
+
+
+def _build_base_template(template: str) -> None:
+    """Populate template with the base repository: README plus one commit.
+
+    Uses libgit2 when available (init, index and commit happen
+    in-process with no subprocess fork), otherwise GitPython.
+    """
+    readme_path = os.path.join(template, "README.md")
+
+    if pygit2 is not None:
+        repo = pygit2.init_repository(template, initial_head="main")
+        repo.config["user.name"] = TEST_USER_NAME
+        repo.config["user.email"] = TEST_USER_EMAIL
+        # Copied into every per-test repo: objects need no durability
+        repo.config["core.fsyncObjectFiles"] = "false"
+        repo.config["gc.auto"] = "0"
+        fastwrite(readme_path, "# Test Repository\n")
+        repo.index.add("README.md")
+        repo.index.write()
+        tree = repo.index.write_tree()
+        signature = pygit2.Signature(TEST_USER_NAME, TEST_USER_EMAIL)
+        repo.create_commit("HEAD", signature, signature, "Initial commit", tree, [])
+        repo.free()
+        return
+
+    from git import Actor, Repo
+
+    actor = Actor(TEST_USER_NAME, TEST_USER_EMAIL)
+    # initial_branch pins the head like the pygit2 path's initial_head;
+    # GIT_CONFIG_GLOBAL masking means the host's init.defaultBranch
+    # cannot supply it
+    repo = Repo.init(template, initial_branch="main")
     with repo.config_writer() as config:
-        config.set_value("user", "name", "Test User")
-        config.set_value("user", "email", "test@example.com")
+        config.set_value("user", "name", TEST_USER_NAME)
+        config.set_value("user", "email", TEST_USER_EMAIL)
+        # Copied into every per-test repo: objects need no durability
+        config.set_value("core", "fsyncObjectFiles", "false")
+        config.set_value("gc", "auto", "0")
+    fastwrite(readme_path, "# Test Repository\n")
+    repo.index.add(["README.md"])
+    repo.index.commit("Initial commit", author=actor, committer=actor)
+    repo.close()
+
+
+@pytest.fixture(scope="session")
+def _git_template_dir(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Build a template Git repository once per session.
+
+    Per-test repositories are cheap directory copies of this template,
+    skipping the git init/config/commit work for every test.
+    """
+    template = str(tmp_path_factory.mktemp("git-template"))
+    _build_base_template(template)
+
+    # Subdirectory trees the discovery tests chdir into; empty dirs are
+    # invisible to git status, so the working tree stays clean. Created
+    # once here instead of per-test makedirs after every copy.
+    for sub in ("subdir/nested", "level1/level2/level3/level4", "src"):
+        os.makedirs(os.path.join(template, sub))
+
+    return template
+
+
+def _build_tagged_template(template: str) -> None:
+    """Add three tagged commits to template.
+
+    Like the base build, prefers libgit2 so commits and tags happen
+    in-process rather than through forked git subprocesses.
+    """
+    test_file = os.path.join(template, "test.txt")
+    versions = ("1.0.0", "1.1.0", "1.1.1")
+
+    if pygit2 is not None:
+        repo = pygit2.Repository(template)
+        signature = pygit2.Signature(TEST_USER_NAME, TEST_USER_EMAIL)
+        content = ""
+        for version in versions:
+            content += f"Version {version}\n"
+            fastwrite(test_file, content)
+            repo.index.add("test.txt")
+            repo.index.write()
+            tree = repo.index.write_tree()
+            oid = repo.create_commit(
+                "HEAD",
+                signature,
+                signature,
+                f"Commit for {version}",
+                tree,
+                [repo.head.target],
+            )
+            repo.references.create(f"refs/tags/{version}", oid)
+        repo.free()
+        return
+
+    from git import Actor, Repo
+
+    repo = Repo(template)
+    actor = Actor(TEST_USER_NAME, TEST_USER_EMAIL)
+    for version in versions:
+        with open(test_file, "a") as f:
+            f.write(f"Version {version}\n")
+        repo.index.add(["test.txt"])
+        repo.index.commit(f"Commit for {version}", author=actor, committer=actor)
+        repo.create_tag(version)
+    repo.close()
+
+
+@pytest.fixture(scope="session")
+def _tagged_template_dir(
+    tmp_path_factory: pytest.TempPathFactory, _git_template_dir: str
+) -> str:
+    """Build a template repository with three tagged commits, once per session."""
+    template = str(tmp_path_factory.mktemp("git-template-tags"))
+    shutil.copytree(_git_template_dir, template, dirs_exist_ok=True)
+    _build_tagged_template(template)
+
+    return template
 
-    # Create initial commit
-    readme_path = os.path.join(temp_dir, "README.md")
-    with open(readme_path, "w") as f:
-        f.write("# Test Repository\n")
 
-    repo.index.add(["README.md"])
-    repo.index.commit("Initial commit")
+@pytest.fixture
+def git_repo(temp_dir: str, _git_template_dir: str) -> Generator[Repo, None, None]:
+    """Create a temporary Git repository by copying the session template."""
+    from git import Repo
 
-    yield repo
+    shutil.copytree(_git_template_dir, temp_dir, dirs_exist_ok=True)
+
+    yield Repo(temp_dir)
 
 
 @pytest.fixture
 def git_manager(git_repo: Repo) -> GitManager:
     """Create a GitManager instance with a test repository."""
+    from grm.git_operations import GitManager
+
     return GitManager(git_repo.working_dir)
 
 
+@pytest.fixture
+def bare_remote(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Create a bare repository to serve as a local push target.
+
+    Lives outside the test's working tree so it never shows up as an
+    untracked path in the repo under test.
+    """
+    path = str(tmp_path_factory.mktemp("bare-remote") / "remote.git")
+    if pygit2 is not None:
+        pygit2.init_repository(path, bare=True).free()
+    else:
+        from git import Repo
+
+        Repo.init(path, bare=True).close()
+    return path
+
+
 @pytest.fixture
 def changelog_manager(temp_dir: str) -> ChangelogManager:
     """Create a ChangelogManager instance."""
@@ -62,79 +297,78 @@ def changelog_manager(temp_dir: str) -> ChangelogManager:
 
 
 @pytest.fixture
+def memory_changelog_manager() -> ChangelogManager:
+    """Create a ChangelogManager over an in-memory buffer.
+
+    Pure-parsing tests need no filesystem round-trip, and the fixture
+    skips temp_dir entirely.
+    """
+    return ChangelogManager(text="")
+
+
+@pytest.fixture(scope="session")
 def sample_changelog_content() -> str:
     """Sample changelog content for testing."""
-    return """# Changelog
+    return SAMPLE_CHANGELOG
 
-All notable changes to this project will be documented in this file.
 
-The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
-and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
+@pytest.fixture(scope="session")
+def _sample_changelog_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Write the sample changelog to disk once per session."""
+    path = tmp_path_factory.mktemp("changelog-template") / "CHANGELOG.md"
+    path.write_text(SAMPLE_CHANGELOG)
+    return str(path)
 
-## Unreleased
 
-### Added
-- New feature X
-- New feature Y
+@pytest.fixture
+def prewritten_changelog_manager(
+    temp_dir: str, _sample_changelog_file: str
+) -> ChangelogManager:
+    """Create a ChangelogManager over a copy of the prewritten sample file."""
+    dest = os.path.join(temp_dir, "CHANGELOG.md")
+    shutil.copy(_sample_changelog_file, dest)
+    return ChangelogManager(dest)
 
-### Fixed
-- Bug fix Z
 
-## 1.0.0 - 2023-12-01
+@pytest.fixture
+def repo_with_tags(temp_dir: str, _tagged_template_dir: str) -> GitManager:
+    """Create a repository with sample tags by copying the session template."""
+    from grm.git_operations import GitManager
 
-### Added
-- Initial release
-"""
+    shutil.copytree(_tagged_template_dir, temp_dir, dirs_exist_ok=True)
 
+    return GitManager(temp_dir)
 
-@pytest.fixture
-def repo_with_tags(git_manager: GitManager) -> GitManager:
-    """Create a repository with sample tags."""
-    # Create some commits and tags
-    repo = git_manager.repo
-
-    # Create and tag version 1.0.0
-    test_file = os.path.join(repo.working_dir, "test.txt")
-    with open(test_file, "w") as f:
-        f.write("Version 1.0.0\n")
-    repo.index.add(["test.txt"])
-    repo.index.commit("Add test file for 1.0.0")
-    repo.create_tag("1.0.0")
-
-    # Create and tag version 1.1.0
-    with open(test_file, "a") as f:
-        f.write("Version 1.1.0\n")
-    repo.index.add(["test.txt"])
-    repo.index.commit("Update for 1.1.0")
-    repo.create_tag("1.1.0")
-
-    # Create and tag version 1.1.1
-    with open(test_file, "a") as f:
-        f.write("Version 1.1.1\n")
-    repo.index.add(["test.txt"])
-    repo.index.commit("Update for 1.1.1")
-    repo.create_tag("1.1.1")
-
-    return git_manager
 
+@pytest.fixture(scope="session")
+def _develop_template_dir(
+    tmp_path_factory: pytest.TempPathFactory, _git_template_dir: str
+) -> str:
+    """Build a template repository with main and develop branches, once per session."""
+    from git import Actor, Repo
 
-@pytest.fixture
-def repo_with_develop_branch(git_manager: GitManager) -> GitManager:
-    """Create a repository with main and develop branches."""
-    repo = git_manager.repo
-
-    # Create develop branch
-    develop_branch = repo.create_head("develop")
-    develop_branch.checkout()
-
-    # Make a commit on develop
-    test_file = os.path.join(repo.working_dir, "develop.txt")
-    with open(test_file, "w") as f:
-        f.write("Development work\n")
-    repo.index.add(["develop.txt"])
-    repo.index.commit("Development commit")
+    template = str(tmp_path_factory.mktemp("git-template-develop"))
+    shutil.copytree(_git_template_dir, template, dirs_exist_ok=True)
+    repo = Repo(template)
+    actor = Actor(TEST_USER_NAME, TEST_USER_EMAIL)
 
-    # Switch back to main
+    # Create develop branch with one commit, then return to main
+    repo.create_head("develop").checkout()
+    test_file = os.path.join(template, "develop.txt")
+    fastwrite(test_file, "Development work\n")
+    repo.index.add(["develop.txt"])
+    repo.index.commit("Development commit", author=actor, committer=actor)
     repo.heads.main.checkout()
+    repo.close()
+
+    return template
+
+
+@pytest.fixture
+def repo_with_develop_branch(temp_dir: str, _develop_template_dir: str) -> GitManager:
+    """Create a repository with main and develop branches from the session template."""
+    from grm.git_operations import GitManager
+
+    shutil.copytree(_develop_template_dir, temp_dir, dirs_exist_ok=True)
 
-    return git_manager
+    return GitManager(temp_dir)
@@ -5,6 +5,17 @@ import pytest
 from datetime import datetime
 
 from grm.changelog import ChangelogManager, ChangelogError
+from tests.conftest import SAMPLE_CHANGELOG, fastwrite
+
+EMPTY_UNRELEASED_CHANGELOG = """# Changelog
+
+## Unreleased
+
+## 1.0.0 - 2023-12-01
+
+### Added
+- Initial release
+"""
 
 
 class TestChangelogManager:
@@ -19,8 +30,7 @@ class TestChangelogManager:
     ):
         """Test changelog_exists when file exists."""
         # Create changelog file
-        with open(changelog_manager.changelog_path, "w") as f:
-            f.write("# Changelog\n")
+        fastwrite(changelog_manager.changelog_path, "# Changelog\n")
 
         assert changelog_manager.changelog_exists() is True
 
@@ -39,8 +49,7 @@ class TestChangelogManager:
     ):
         """Test reading changelog file successfully."""
         # Create changelog file
-        with open(changelog_manager.changelog_path, "w") as f:
-            f.write(sample_changelog_content)
+        fastwrite(changelog_manager.changelog_path, sample_changelog_content)
 
         content = changelog_manager.read_changelog()
         assert content == sample_changelog_content
@@ -60,12 +69,10 @@ class TestChangelogManager:
         assert read_content == content
 
     def test_extract_unreleased_content(
-        self, changelog_manager: ChangelogManager, sample_changelog_content: str
+        self, prewritten_changelog_manager: ChangelogManager
     ):
         """Test extracting unreleased content."""
-        changelog_manager.write_changelog(sample_changelog_content)
-
-        unreleased = changelog_manager.extract_unreleased_content()
+        unreleased = prewritten_changelog_manager.extract_unreleased_content()
 
         assert "### Added" in unreleased
         assert "- New feature X" in unreleased
@@ -78,25 +85,16 @@ class TestChangelogManager:
         assert "Initial release" not in unreleased
 
     def test_extract_unreleased_content_empty(
-        self, changelog_manager: ChangelogManager
+        self, memory_changelog_manager: ChangelogManager
     ):
         """Test extracting unreleased content when empty."""
-        content = """# Changelog
+        memory_changelog_manager.write_changelog(EMPTY_UNRELEASED_CHANGELOG)
 
-## Unreleased
-
-## 1.0.0 - 2023-12-01
-
-### Added
-- Initial release
-"""
-        changelog_manager.write_changelog(content)
-
-        unreleased = changelog_manager.extract_unreleased_content()
+        unreleased = memory_changelog_manager.extract_unreleased_content()
         assert unreleased == []
 
     def test_extract_unreleased_content_no_section(
-        self, changelog_manager: ChangelogManager
+        self, memory_changelog_manager: ChangelogManager
     ):
         """Test extracting unreleased content when section doesn't exist."""
         content = """# Changelog
@@ -106,32 +104,39 @@ class TestChangelogManager:
 ### Added
 - Initial release
 """
-        changelog_manager.write_changelog(content)
+        memory_changelog_manager.write_changelog(content)
 
         with pytest.raises(ChangelogError, match="Unreleased.*not found"):
-            changelog_manager.extract_unreleased_content()
+            memory_changelog_manager.extract_unreleased_content()
 
     def test_move_unreleased_to_version(
-        self, changelog_manager: ChangelogManager, sample_changelog_content: str
+        self, prewritten_changelog_manager: ChangelogManager
     ):
         """Test moving unreleased content to version section."""
-        changelog_manager.write_changelog(sample_changelog_content)
+        prewritten_changelog_manager.move_unreleased_to_version("1.2.0", "2024-01-15")
 
-        changelog_manager.move_unreleased_to_version("1.2.0", "2024-01-15")
-
-        updated_content = changelog_manager.read_changelog()
+        updated_content = prewritten_changelog_manager.read_changelog()
 
         # Check that new version section was created
         assert "## 1.2.0 - 2024-01-15" in updated_content
 
-        # Check that unreleased content was moved
-        lines = updated_content.split("\n")
-        unreleased_idx = next(
-            i for i, line in enumerate(lines) if line.strip() == "## Unreleased"
-        )
-        version_idx = next(
-            i for i, line in enumerate(lines) if "## 1.2.0 - 2024-01-15" in line
-        )
+        # Locate the section boundaries in a single pass over the lines
+        lines = updated_content.splitlines()
+        unreleased_idx = None
+        version_idx = None
+        next_version_idx = len(lines)
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if stripped == "## Unreleased":
+                unreleased_idx = i
+            elif "## 1.2.0 - 2024-01-15" in stripped:
+                version_idx = i
+            elif version_idx is not None and stripped.startswith("## "):
+                next_version_idx = i
+                break
+
+        assert unreleased_idx is not None
+        assert version_idx is not None
 
         # Unreleased section should now be empty (or minimal)
         unreleased_section = lines[unreleased_idx:version_idx]
@@ -139,14 +144,6 @@ class TestChangelogManager:
         assert len(content_lines) == 0  # Should be empty now
 
         # Version section should contain the moved content
-        next_version_idx = next(
-            (
-                i
-                for i, line in enumerate(lines[version_idx + 1 :], version_idx + 1)
-                if line.strip().startswith("## ")
-            ),
-            len(lines),
-        )
         version_section = lines[version_idx:next_version_idx]
         version_content = "\n".join(version_section)
 
@@ -157,44 +154,33 @@ class TestChangelogManager:
         assert "- Bug fix Z" in version_content
 
     def test_move_unreleased_to_version_default_date(
-        self, changelog_manager: ChangelogManager, sample_changelog_content: str
+        self, prewritten_changelog_manager: ChangelogManager
     ):
         """Test moving unreleased content with default date (today)."""
-        changelog_manager.write_changelog(sample_changelog_content)
-
         today = datetime.now().strftime("%Y-%m-%d")
-        changelog_manager.move_unreleased_to_version("1.2.0")
+        prewritten_changelog_manager.move_unreleased_to_version("1.2.0")
 
-        updated_content = changelog_manager.read_changelog()
+        updated_content = prewritten_changelog_manager.read_changelog()
         assert f"## 1.2.0 - {today}" in updated_content
 
     def test_move_unreleased_to_version_invalid_date(
-        self, changelog_manager: ChangelogManager, sample_changelog_content: str
+        self, prewritten_changelog_manager: ChangelogManager
     ):
         """Test moving unreleased content with invalid date format."""
-        changelog_manager.write_changelog(sample_changelog_content)
-
         with pytest.raises(ChangelogError, match="Invalid date format"):
-            changelog_manager.move_unreleased_to_version("1.2.0", "invalid-date")
+            prewritten_changelog_manager.move_unreleased_to_version(
+                "1.2.0", "invalid-date"
+            )
 
     def test_move_unreleased_to_version_empty_content(
-        self, changelog_manager: ChangelogManager
+        self, memory_changelog_manager: ChangelogManager
     ):
         """Test moving empty unreleased content."""
-        content = """# Changelog
-
-## Unreleased
-
-## 1.0.0 - 2023-12-01
+        memory_changelog_manager.write_changelog(EMPTY_UNRELEASED_CHANGELOG)
 
-### Added
-- Initial release
-"""
-        changelog_manager.write_changelog(content)
+        memory_changelog_manager.move_unreleased_to_version("1.1.0", "2024-01-15")
 
-        changelog_manager.move_unreleased_to_version("1.1.0", "2024-01-15")
-
-        updated_content = changelog_manager.read_changelog()
+        updated_content = memory_changelog_manager.read_changelog()
 
         # Should not create version section for empty content
         assert "## 1.1.0 - 2024-01-15" not in updated_content
@@ -202,42 +188,35 @@ class TestChangelogManager:
         # Unreleased section should still exist and be empty
         assert "## Unreleased" in updated_content
 
-    def test_has_unreleased_content_true(
-        self, changelog_manager: ChangelogManager, sample_changelog_content: str
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (SAMPLE_CHANGELOG, True),
+            (EMPTY_UNRELEASED_CHANGELOG, False),
+            (None, False),
+        ],
+        ids=["with_content", "empty_section", "no_file"],
+    )
+    def test_has_unreleased_content(
+        self,
+        changelog_manager: ChangelogManager,
+        content: str,
+        expected: bool,
     ):
-        """Test has_unreleased_content when content exists."""
-        changelog_manager.write_changelog(sample_changelog_content)
-        assert changelog_manager.has_unreleased_content() is True
-
-    def test_has_unreleased_content_false(self, changelog_manager: ChangelogManager):
-        """Test has_unreleased_content when no content exists."""
-        content = """# Changelog
-
-## Unreleased
-
-## 1.0.0 - 2023-12-01
-
-### Added
-- Initial release
-"""
-        changelog_manager.write_changelog(content)
-        assert changelog_manager.has_unreleased_content() is False
+        """Test has_unreleased_content across content/empty/missing variants."""
+        if content is not None:
+            changelog_manager.write_changelog(content)
+        assert changelog_manager.has_unreleased_content() is expected
 
-    def test_has_unreleased_content_no_file(self, changelog_manager: ChangelogManager):
-        """Test has_unreleased_content when file doesn't exist."""
-        assert changelog_manager.has_unreleased_content() is False
-
-    def test_get_version_sections(
-        self, changelog_manager: ChangelogManager, sample_changelog_content: str
-    ):
+    def test_get_version_sections(self, prewritten_changelog_manager: ChangelogManager):
         """Test getting version sections from changelog."""
-        changelog_manager.write_changelog(sample_changelog_content)
-
-        versions = changelog_manager.get_version_sections()
+        versions = prewritten_changelog_manager.get_version_sections()
         assert len(versions) == 1
         assert versions[0] == ("1.0.0", "2023-12-01")
 
-    def test_get_version_sections_multiple(self, changelog_manager: ChangelogManager):
+    def test_get_version_sections_multiple(
+        self, memory_changelog_manager: ChangelogManager
+    ):
         """Test getting multiple version sections."""
         content = """# Changelog
 
@@ -258,23 +237,34 @@ class TestChangelogManager:
 ### Added
 - Initial release
 """
-        changelog_manager.write_changelog(content)
+        memory_changelog_manager.write_changelog(content)
 
-        versions = changelog_manager.get_version_sections()
+        versions = memory_changelog_manager.get_version_sections()
         assert len(versions) == 3
         assert versions[0] == ("2.0.0", "2024-01-15")
         assert versions[1] == ("1.1.0", "2023-12-15")
         assert versions[2] == ("1.0.0", "2023-12-01")
 
     def test_validate_changelog_format_valid(
-        self, changelog_manager: ChangelogManager, sample_changelog_content: str
+        self, prewritten_changelog_manager: ChangelogManager
     ):
         """Test validating valid changelog format."""
-        changelog_manager.write_changelog(sample_changelog_content)
-
-        issues = changelog_manager.validate_changelog_format()
+        issues = prewritten_changelog_manager.validate_changelog_format()
         assert issues == []
 
+    def test_in_memory_mode(
+        self, memory_changelog_manager: ChangelogManager, temp_dir: str
+    ):
+        """Test that the in-memory mode round-trips without touching disk."""
+        assert memory_changelog_manager.changelog_exists() is True
+
+        memory_changelog_manager.write_changelog(SAMPLE_CHANGELOG)
+        assert memory_changelog_manager.read_changelog() == SAMPLE_CHANGELOG
+
+        memory_changelog_manager.move_unreleased_to_version("1.2.0", "2024-01-15")
+        assert "## 1.2.0 - 2024-01-15" in memory_changelog_manager.read_changelog()
+        assert not os.path.exists(memory_changelog_manager.changelog_path)
+
     def test_validate_changelog_format_no_file(
         self, changelog_manager: ChangelogManager
     ):
@@ -283,7 +273,7 @@ class TestChangelogManager:
         assert "does not exist" in issues[0]
 
     def test_validate_changelog_format_no_unreleased(
-        self, changelog_manager: ChangelogManager
+        self, memory_changelog_manager: ChangelogManager
     ):
         """Test validating when no unreleased section exists."""
         content = """# Changelog
@@ -293,8 +283,7 @@ class TestChangelogManager:
 ### Added
 - Initial release
 """
-        changelog_manager.write_changelog(content)
+        memory_changelog_manager.write_changelog(content)
 
-        issues = changelog_manager.validate_changelog_format()
+        issues = memory_changelog_manager.validate_changelog_format()
         assert any("Missing '## Unreleased' section" in issue for issue in issues)
-
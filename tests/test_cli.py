@@ -1,1026 +1,755 @@
 """Tests for cli module."""
 
-import os
-from unittest.mock import patch, Mock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
+import click
 import pytest
 from click.testing import CliRunner
 
-from grm.cli import cli, release, hotfix, finish
-from grm.git_operations import GitOperationError
-from grm.changelog import ChangelogError
-
-
-class TestCLI:
-    """Test cases for CLI commands."""
-
-    @staticmethod
-    def _create_git_mock() -> Mock:
-        """Create a GitManager mock with release checks disabled by default."""
-        git_mock = Mock()
-        git_mock.get_release_branch_names.return_value = []
-        git_mock.get_version_branch_names.return_value = []
-        return git_mock
-
-    def test_cli_no_command(self):
-        """Test CLI with no command shows help."""
-        runner = CliRunner()
-        result = runner.invoke(cli)
-
-        assert result.exit_code == 0
-        assert "Git Release Manager" in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_release_command_success(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test successful release command execution."""
-        # Setup mocks
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.get_all_tags.return_value = ["1.0.0", "1.1.0"]
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.suggest_version.return_value = Mock(__str__=lambda x: "1.2.0")
-        mock_version_manager.return_value = version_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"], input="y\n")
-
-        assert result.exit_code == 0
-        assert "Release branch 'release/1.2.0' created successfully" in result.output
-
-        # Verify method calls
-        git_mock.create_branch.assert_called_once_with("release/1.2.0", checkout=True)
-        changelog_mock.move_unreleased_to_version.assert_called_once()
-        git_mock.commit_changes.assert_called_once_with(
-            "Changelog", files=["CHANGELOG.md"]
-        )
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_release_command_patch_flag(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command with patch flag."""
-        # Setup mocks
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.get_all_tags.return_value = ["1.0.0"]
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.suggest_version.return_value = Mock(__str__=lambda x: "1.0.1")
-        mock_version_manager.return_value = version_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--patch"], input="y\n")
-
-        assert result.exit_code == 0
-        version_mock.suggest_version.assert_called_with("patch")
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_release_command_major_flag(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command with major flag."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.get_all_tags.return_value = ["1.0.0"]
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.suggest_version.return_value = Mock(__str__=lambda x: "2.0.0")
-        mock_version_manager.return_value = version_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--major"], input="y\n")
-
-        assert result.exit_code == 0
-        version_mock.suggest_version.assert_called_with("major")
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    def test_release_command_dirty_working_directory(
-        self, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command with dirty working directory."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"])
-
-        assert result.exit_code == 1
-        assert "uncommitted changes" in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    def test_release_command_stops_when_release_branch_exists(
-        self, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command stops when a release branch already exists."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.has_remote.return_value = True
-        git_mock.get_version_branch_names.return_value = [
-            "release/1.1.0",
-            "release/1.2.0",
-        ]
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"])
-
-        assert result.exit_code == 1
-        assert "Existing release branch found" in result.output
-        assert "release/1.1.0, release/1.2.0" in result.output
-        git_mock.get_version_branch_names.assert_called_once_with(
-            "release", fetch_remote=True
-        )
-        git_mock.create_branch.assert_not_called()
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    def test_release_command_wrong_branch(
-        self, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command on wrong branch."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "feature-branch"
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"])
-
-        assert result.exit_code == 1
-        assert "Must be on 'main' branch" in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_release_command_from_develop_branch(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test successful release command from develop branch."""
-        # Setup mocks
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = (
-            "develop"  # Should return develop when it exists
-        )
-        git_mock.get_current_branch_name.return_value = "develop"
-        git_mock.get_all_tags.return_value = ["1.0.0", "1.1.0"]
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.suggest_version.return_value = Mock(__str__=lambda x: "1.2.0")
-        mock_version_manager.return_value = version_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"], input="y\n")
-
-        assert result.exit_code == 0
-        assert "Release branch 'release/1.2.0' created successfully" in result.output
-
-        # Verify method calls
-        git_mock.create_branch.assert_called_once_with("release/1.2.0", checkout=True)
-        changelog_mock.move_unreleased_to_version.assert_called_once()
-        git_mock.commit_changes.assert_called_once_with(
-            "Changelog", files=["CHANGELOG.md"]
-        )
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    def test_release_command_wrong_branch_with_develop(
-        self, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command on wrong branch when develop exists - prompt to switch."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "develop"
-        git_mock.get_current_branch_name.return_value = "feature-branch"
-        git_mock.branch_exists.return_value = True
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        # Decline the prompt to switch branches
-        result = runner.invoke(release, ["--minor"], input="n\n")
-
-        assert result.exit_code == 1
-        assert "Currently on 'feature-branch' branch" in result.output
-        assert "Switch to 'develop' branch and continue?" in result.output
-        assert "Release creation cancelled." in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    def test_release_command_wrong_branch_with_develop_accept_switch(
-        self, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command on wrong branch when develop exists - accept switch."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "develop"
-        git_mock.get_current_branch_name.return_value = "feature-branch"
-        git_mock.branch_exists.return_value = True
-        git_mock.get_all_tags.return_value = ["0.1.0"]
-        git_mock.has_remote.return_value = True
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        runner = CliRunner()
-        # Accept the prompt to switch branches, then confirm the release creation
-        result = runner.invoke(release, ["--minor"], input="y\ny\n")
-
-        assert result.exit_code == 0
+import grm.changelog
+import grm.cli
+import grm.git_operations
+import grm.version_manager
+from grm.changelog import ChangelogManager
+from grm.cli import cli, release, hotfix, finish, _prompt_for_bump_type
+from grm.git_operations import GitManager, GitOperationError
+
+# Bound before mock_managers swaps the module attribute, so the prompt
+# tests keep the real implementation
+from grm.version_manager import VersionManager
+
+
+def answers(*replies: str) -> str:
+    """Build a stdin payload from ordered prompt replies.
+
+    Spells out multi-prompt flows as answers("y", "y") instead of
+    opaque "y\ny\n" literals; the common sequences below are built
+    once at import time.
+    """
+    return "".join(reply + "\n" for reply in replies)
+
+
+# Prompt answer sequences reused across invoke() calls
+YES = answers("y")
+NO = answers("n")
+YES_YES = answers("y", "y")
+
+
+def assert_all_in(haystack: str, *needles: str) -> None:
+    """Assert that every needle occurs in haystack, reporting all misses at once."""
+    missing = [needle for needle in needles if needle not in haystack]
+    assert not missing, f"not found in output: {missing}"
+
+
+@pytest.fixture
+def happy_git_mock() -> Mock:
+    """GitManager mock pre-configured for the happy path.
+
+    Clean tree on main, one tag, no remote, no open release branches;
+    tests override only the attributes their scenario deviates in.
+    spec keeps the mock honest against GitManager's real surface and
+    lets mock cache the attribute list per class.
+    """
+    git = Mock(spec=GitManager)
+    git.is_working_directory_clean.return_value = True
+    git.get_release_source_branch.return_value = "main"
+    git.get_integration_branch.return_value = "main"
+    git.get_current_branch_name.return_value = "main"
+    git.get_all_tags.return_value = ["1.0.0"]
+    git.get_release_branch_names.return_value = []
+    git.get_version_branch_names.return_value = []
+    git.branch_exists.return_value = True
+    git.has_remote.return_value = False
+    return git
+
+
+@pytest.fixture
+def happy_changelog_mock() -> Mock:
+    """ChangelogManager mock with a valid changelog holding unreleased content."""
+    changelog = Mock(spec=ChangelogManager)
+    changelog.changelog_exists.return_value = True
+    changelog.validate_changelog_format.return_value = []
+    changelog.has_unreleased_content.return_value = True
+    return changelog
+
+
+@pytest.fixture
+def happy_version_mock() -> Mock:
+    """VersionManager mock suggesting 1.2.0 as the next version."""
+    version = Mock(spec=VersionManager)
+    # cli only ever str()-formats the suggested version, so a plain
+    # string stands in for a Version without building a Mock hierarchy
+    version.suggest_version.return_value = "1.2.0"
+    return version
+
+
+@pytest.fixture(autouse=True)
+def mock_managers(
+    monkeypatch: pytest.MonkeyPatch,
+    happy_git_mock: Mock,
+    happy_changelog_mock: Mock,
+    happy_version_mock: Mock,
+) -> SimpleNamespace:
+    """Install the pre-configured Mock managers into the CLI's modules.
+
+    One fixture replaces the 2-3 @patch decorators every test used to
+    stack: monkeypatch swaps each manager class for a factory returning
+    the happy-path Mock, and undoing is a plain attribute write instead
+    of mock.patch's enter/exit machinery.
+    """
+    # Object form: the modules are already imported above, so no
+    # dotted-string target resolution happens per test
+    monkeypatch.setattr(
+        grm.git_operations, "GitManager", lambda *a, **k: happy_git_mock
+    )
+    monkeypatch.setattr(
+        grm.changelog, "ChangelogManager", lambda *a, **k: happy_changelog_mock
+    )
+    monkeypatch.setattr(
+        grm.version_manager, "VersionManager", lambda *a, **k: happy_version_mock
+    )
+    return SimpleNamespace(
+        git=happy_git_mock, changelog=happy_changelog_mock, version=happy_version_mock
+    )
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """One CliRunner shared by the module.
+
+    The runner is stateless across invocations; every invoke() still
+    builds its own isolation context and Result.
+    """
+    return CliRunner()
+
+
+def test_cli_no_command(runner: CliRunner):
+    """Test CLI with no command shows help."""
+    result = runner.invoke(cli)
+
+    assert result.exit_code == 0
+    assert "Git Release Manager" in result.output
+
+
+def test_release_command_success(mock_managers: SimpleNamespace, runner: CliRunner):
+    """Test successful release command execution."""
+    git_mock = mock_managers.git
+
+    result = runner.invoke(release, ["--minor"], input=YES)
+
+    assert result.exit_code == 0
+    assert "Release branch 'release/1.2.0' created successfully" in result.output
+
+    # Verify method calls
+    git_mock.create_branch.assert_called_once_with("release/1.2.0", checkout=True)
+    mock_managers.changelog.move_unreleased_to_version.assert_called_once()
+    git_mock.commit_changes.assert_called_once_with("Changelog", files=["CHANGELOG.md"])
+
+
+def test_release_command_patch_flag(
+    mock_managers: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+):
+    """Test release command with patch flag."""
+    # No output assertions here, so skip CliRunner's stdio redirection
+    # and invoke the command callback directly
+    monkeypatch.setattr(click, "confirm", lambda *a, **kw: True)
+    release.callback(bump_type="patch")
+
+    mock_managers.version.suggest_version.assert_called_with("patch")
+
+
+def test_release_command_major_flag(
+    mock_managers: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+):
+    """Test release command with major flag."""
+    monkeypatch.setattr(click, "confirm", lambda *a, **kw: True)
+    release.callback(bump_type="major")
+
+    mock_managers.version.suggest_version.assert_called_with("major")
+
+
+def test_release_command_dirty_working_directory(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test release command with dirty working directory."""
+    mock_managers.git.is_working_directory_clean.return_value = False
+
+    result = runner.invoke(release, ["--minor"])
+
+    assert result.exit_code == 1
+    assert "uncommitted changes" in result.output
+
+
+def test_release_command_stops_when_release_branch_exists(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test release command stops when a release branch already exists."""
+    git_mock = mock_managers.git
+    git_mock.has_remote.return_value = True
+    git_mock.get_version_branch_names.return_value = [
+        "release/1.1.0",
+        "release/1.2.0",
+    ]
+
+    result = runner.invoke(release, ["--minor"])
+
+    assert result.exit_code == 1
+    assert_all_in(
+        result.output,
+        "Existing release branch found",
+        "release/1.1.0, release/1.2.0",
+    )
+    git_mock.get_version_branch_names.assert_called_once_with(
+        "release", fetch_remote=True
+    )
+    git_mock.create_branch.assert_not_called()
+
+
+def test_release_command_wrong_branch(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test release command on wrong branch."""
+    git_mock = mock_managers.git
+    git_mock.get_current_branch_name.return_value = "feature-branch"
+    git_mock.branch_exists.return_value = False  # no develop to offer
+
+    result = runner.invoke(release, ["--minor"])
+
+    assert result.exit_code == 1
+    assert "Must be on 'main' branch" in result.output
+
+
+def test_release_command_from_develop_branch(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test successful release command from develop branch."""
+    git_mock = mock_managers.git
+    # get_release_source_branch should return develop when it exists
+    git_mock.get_release_source_branch.return_value = "develop"
+    git_mock.get_current_branch_name.return_value = "develop"
+
+    result = runner.invoke(release, ["--minor"], input=YES)
+
+    assert result.exit_code == 0
+    assert "Release branch 'release/1.2.0' created successfully" in result.output
+
+    # Verify method calls
+    git_mock.create_branch.assert_called_once_with("release/1.2.0", checkout=True)
+    mock_managers.changelog.move_unreleased_to_version.assert_called_once()
+    git_mock.commit_changes.assert_called_once_with("Changelog", files=["CHANGELOG.md"])
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "user_input,has_remote,pull_error,exit_code,pull_calls,expected",
+    [
+        pytest.param(
+            "n\n",
+            False,
+            None,
+            1,
+            0,
+            [
+                "Currently on 'feature-branch' branch",
+                "Switch to 'develop' branch and continue?",
+                "Release creation cancelled.",
+            ],
+            id="decline",
+        ),
+        pytest.param(
+            "y\ny\n",
+            True,
+            None,
+            0,
+            1,
+            [
+                "Switched to 'develop' branch",
+                "Pulled latest changes",
+                "Release branch 'release/0.2.0' created successfully!",
+            ],
+            id="accept-pull",
+        ),
+        pytest.param(
+            "y\ny\n",
+            False,
+            None,
+            0,
+            0,
+            [
+                "Switched to 'develop' branch",
+                "Release branch 'release/0.2.0' created successfully!",
+            ],
+            id="accept-no-remote",
+        ),
+        pytest.param(
+            "y\ny\n",
+            True,
+            GitOperationError("Network error"),
+            0,
+            1,
+            [
+                "Switched to 'develop' branch",
+                "Failed to pull latest changes",
+                "Continuing with local version",
+                "Release branch 'release/0.2.0' created successfully!",
+            ],
+            id="accept-pull-fails",
+        ),
+    ],
+)
+def test_release_command_wrong_branch_switch(
+    mock_managers: SimpleNamespace,
+    runner: CliRunner,
+    user_input: str,
+    has_remote: bool,
+    pull_error,
+    exit_code: int,
+    pull_calls: int,
+    expected,
+):
+    """Test the switch-to-develop prompt across decline/accept variants."""
+    git_mock = mock_managers.git
+    git_mock.get_release_source_branch.return_value = "develop"
+    git_mock.get_current_branch_name.return_value = "feature-branch"
+    git_mock.has_remote.return_value = has_remote
+    git_mock.pull_branch.side_effect = pull_error
+    mock_managers.version.suggest_version.return_value = "0.2.0"
+
+    result = runner.invoke(release, ["--minor"], input=user_input)
+
+    assert result.exit_code == exit_code
+    assert git_mock.pull_branch.call_count == pull_calls
+    if pull_calls:
+        git_mock.pull_branch.assert_called_with("develop")
+    if exit_code == 0:
         git_mock.checkout_branch.assert_called_with("develop")
-        git_mock.pull_branch.assert_called_once_with("develop")
-        assert "Switched to 'develop' branch" in result.output
-        assert "Pulled latest changes" in result.output
-        assert "Release branch 'release/0.2.0' created successfully!" in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    def test_release_command_wrong_branch_accept_switch_no_remote(
-        self, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command on wrong branch - accept switch without remote."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "develop"
-        git_mock.get_current_branch_name.return_value = "feature-branch"
-        git_mock.branch_exists.return_value = True
-        git_mock.get_all_tags.return_value = ["0.1.0"]
-        git_mock.has_remote.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"], input="y\ny\n")
-
-        assert result.exit_code == 0
-        git_mock.checkout_branch.assert_called_with("develop")
-        git_mock.pull_branch.assert_not_called()
-        assert "Switched to 'develop' branch" in result.output
-        assert "Release branch 'release/0.2.0' created successfully!" in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    def test_release_command_wrong_branch_accept_switch_pull_fails(
-        self, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command on wrong branch - accept switch but pull fails."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "develop"
-        git_mock.get_current_branch_name.return_value = "feature-branch"
-        git_mock.branch_exists.return_value = True
-        git_mock.get_all_tags.return_value = ["0.1.0"]
-        git_mock.has_remote.return_value = True
-        git_mock.pull_branch.side_effect = GitOperationError("Network error")
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"], input="y\ny\n")
-
-        assert result.exit_code == 0
-        git_mock.checkout_branch.assert_called_with("develop")
-        git_mock.pull_branch.assert_called_once_with("develop")
-        assert "Switched to 'develop' branch" in result.output
-        assert "Failed to pull latest changes" in result.output
-        assert "Continuing with local version" in result.output
-        assert "Release branch 'release/0.2.0' created successfully!" in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    def test_release_command_no_changelog(
-        self, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command with no changelog."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = False
-        mock_changelog_manager.return_value = changelog_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"], input="n\n")
-
-        assert result.exit_code == 1
-        assert "CHANGELOG.md is required" in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_release_command_no_unreleased_content(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command with no unreleased content."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.get_all_tags.return_value = []
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = False
-        mock_changelog_manager.return_value = changelog_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"], input="n\n")
-
-        assert result.exit_code == 1
-        assert "no content to release" in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_release_command_version_mismatch(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command fails when changelog version doesn't match latest tag."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.get_all_tags.return_value = ["2.0.0", "2.1.0", "2.2.0"]
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        changelog_mock.get_version_sections.return_value = [("3.0.0", "2025-11-26"), ("2.2.0", "2025-11-25")]
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.get_latest_version.return_value = Mock(__str__=lambda x: "2.2.0")
-        mock_version_manager.return_value = version_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"])
-
-        assert result.exit_code == 1
-        assert "Version mismatch" in result.output
-        assert "CHANGELOG.md has 3.0.0" in result.output
-        assert "latest git tag is 2.2.0" in result.output
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    @patch("grm.cli._prompt_for_bump_type")
-    def test_release_command_prompt_for_bump_type(
-        self,
-        mock_prompt,
-        mock_version_manager,
-        mock_changelog_manager,
-        mock_git_manager,
-    ):
-        """Test release command prompting for bump type."""
-        # Setup mocks
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.get_all_tags.return_value = []
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.suggest_version.return_value = Mock(__str__=lambda x: "0.1.0")
-        mock_version_manager.return_value = version_mock
-
-        mock_prompt.return_value = "minor"
-
-        runner = CliRunner()
-        result = runner.invoke(release, input="y\n")
-
-        assert result.exit_code == 0
-        mock_prompt.assert_called_once()
-        version_mock.suggest_version.assert_called_with("minor")
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_release_command_push_with_remote(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command pushes branch when remote exists."""
-        # Setup mocks
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.get_all_tags.return_value = ["1.0.0"]
-        git_mock.has_remote.return_value = True
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.suggest_version.return_value = Mock(__str__=lambda x: "1.1.0")
-        mock_version_manager.return_value = version_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"], input="y\n")
-
-        assert result.exit_code == 0
-        assert "✓ Pushed release/1.1.0 to remote" in result.output
-
-        # Verify push was called with upstream tracking
-        git_mock.push_branch.assert_called_once_with("release/1.1.0", set_upstream=True)
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_release_command_no_push_without_remote(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command skips push when no remote exists."""
-        # Setup mocks
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.get_all_tags.return_value = ["1.0.0"]
-        git_mock.has_remote.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.suggest_version.return_value = Mock(__str__=lambda x: "1.1.0")
-        mock_version_manager.return_value = version_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"], input="y\n")
-
-        assert result.exit_code == 0
-        assert "Pushing release branch to remote" not in result.output
-
-        # Verify push was not called
+    assert_all_in(result.output, *expected)
+
+
+def test_release_command_no_changelog(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test release command with no changelog."""
+    mock_managers.changelog.changelog_exists.return_value = False
+
+    result = runner.invoke(release, ["--minor"], input=NO)
+
+    assert result.exit_code == 1
+    assert "CHANGELOG.md is required" in result.output
+
+
+def test_release_command_no_unreleased_content(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test release command with no unreleased content."""
+    mock_managers.changelog.has_unreleased_content.return_value = False
+
+    result = runner.invoke(release, ["--minor"], input=NO)
+
+    assert result.exit_code == 1
+    assert "no content to release" in result.output
+
+
+def test_release_command_version_mismatch(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test release command fails when changelog version doesn't match latest tag."""
+    mock_managers.git.get_all_tags.return_value = ["2.0.0", "2.1.0", "2.2.0"]
+    mock_managers.changelog.get_version_sections.return_value = [
+        ("3.0.0", "2025-11-26"),
+        ("2.2.0", "2025-11-25"),
+    ]
+    mock_managers.version.get_latest_version.return_value = Mock(
+        __str__=lambda x: "2.2.0"
+    )
+
+    result = runner.invoke(release, ["--minor"])
+
+    assert result.exit_code == 1
+    assert_all_in(
+        result.output,
+        "Version mismatch",
+        "CHANGELOG.md has 3.0.0",
+        "latest git tag is 2.2.0",
+    )
+
+
+def test_release_command_prompt_for_bump_type(
+    mock_managers: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+):
+    """Test release command prompting for bump type."""
+    mock_prompt = Mock(return_value="minor")
+    monkeypatch.setattr(grm.cli, "_prompt_for_bump_type", mock_prompt)
+    monkeypatch.setattr(click, "confirm", lambda *a, **kw: True)
+
+    release.callback(bump_type=None)
+
+    mock_prompt.assert_called_once()
+    mock_managers.version.suggest_version.assert_called_with("minor")
+
+
+@pytest.mark.parametrize(
+    "has_remote,push_error,expect_push,expected,not_expected",
+    [
+        pytest.param(
+            True,
+            None,
+            True,
+            ["\u2713 Pushed release/1.2.0 to remote"],
+            [],
+            id="push-with-remote",
+        ),
+        pytest.param(
+            False,
+            None,
+            False,
+            [],
+            ["Pushing release branch to remote"],
+            id="no-push-without-remote",
+        ),
+        pytest.param(
+            True,
+            GitOperationError("Push failed"),
+            True,
+            [
+                "Failed to push release branch: Push failed",
+                "You may need to push manually",
+            ],
+            [],
+            id="push-failure",
+        ),
+    ],
+)
+def test_release_command_push_behavior(
+    mock_managers: SimpleNamespace,
+    runner: CliRunner,
+    has_remote: bool,
+    push_error,
+    expect_push: bool,
+    expected,
+    not_expected,
+):
+    """Test release push behavior across remote/no-remote/failure variants."""
+    git_mock = mock_managers.git
+    git_mock.has_remote.return_value = has_remote
+    if push_error is not None:
+        git_mock.push_branch.side_effect = push_error
+
+    result = runner.invoke(release, ["--minor"], input=YES)
+
+    # A push failure must not fail the release itself
+    assert result.exit_code == 0
+    if expect_push:
+        git_mock.push_branch.assert_called_once_with("release/1.2.0", set_upstream=True)
+    else:
         git_mock.push_branch.assert_not_called()
+    assert_all_in(result.output, *expected)
+    for snippet in not_expected:
+        assert snippet not in result.output
+
+
+def test_hotfix_command_success(mock_managers: SimpleNamespace, runner: CliRunner):
+    """Test successful hotfix command execution."""
+    git_mock = mock_managers.git
+    git_mock.get_release_source_branch.return_value = "develop"
+    git_mock.get_current_branch_name.return_value = "develop"
+    git_mock.has_remote.return_value = True
+
+    result = runner.invoke(hotfix, ["--minor"], input=YES)
+
+    assert result.exit_code == 0
+    assert "Hotfix branch 'hotfix/1.2.0' created successfully" in result.output
+    git_mock.create_branch.assert_called_once_with("hotfix/1.2.0", checkout=True)
+    mock_managers.changelog.move_unreleased_to_version.assert_called_once_with("1.2.0")
+    git_mock.commit_changes.assert_called_once_with("Changelog", files=["CHANGELOG.md"])
+    git_mock.push_branch.assert_called_once_with("hotfix/1.2.0", set_upstream=True)
+
+
+def test_hotfix_command_stops_when_hotfix_branch_exists(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test hotfix command stops when a hotfix branch already exists."""
+    git_mock = mock_managers.git
+    git_mock.get_release_source_branch.return_value = "develop"
+    git_mock.get_current_branch_name.return_value = "develop"
+    git_mock.has_remote.return_value = True
+    git_mock.get_version_branch_names.return_value = [
+        "hotfix/1.1.1",
+        "hotfix/1.1.2",
+    ]
+
+    result = runner.invoke(hotfix, ["--patch"])
+
+    assert result.exit_code == 1
+    assert_all_in(
+        result.output,
+        "Existing hotfix branch found",
+        "hotfix/1.1.1, hotfix/1.1.2",
+    )
+    git_mock.get_version_branch_names.assert_called_once_with(
+        "hotfix", fetch_remote=True
+    )
+    git_mock.create_branch.assert_not_called()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "develop_exists,has_remote,final_branch,expected_refspecs,expected,not_expected",
+    [
+        pytest.param(
+            True,
+            False,
+            "develop",
+            None,
+            [
+                "Release 1.2.0 finished successfully",
+                "Merging back to develop",
+                "\u2713 Switched to develop branch",
+            ],
+            ["Pushing changes to remote..."],
+            id="develop-no-remote",
+        ),
+        pytest.param(
+            False,
+            False,
+            "main",
+            None,
+            [
+                "Release 1.2.0 finished successfully",
+                "No 'develop' branch found",
+                "\u2713 Switched to main branch",
+            ],
+            ["Push all changes to remote?", "Pushing changes to remote..."],
+            id="no-develop-no-remote",
+        ),
+        pytest.param(
+            True,
+            True,
+            "develop",
+            ["main", "refs/tags/*:refs/tags/*", "develop"],
+            [
+                "Pushing changes to remote...",
+                "\u2713 Pushed main",
+                "\u2713 Pushed tag 1.2.0",
+                "\u2713 Pushed develop",
+            ],
+            [],
+            id="develop-remote",
+        ),
+        pytest.param(
+            False,
+            True,
+            "main",
+            ["main", "refs/tags/*:refs/tags/*"],
+            [
+                "Pushing changes to remote...",
+                "\u2713 Pushed main",
+                "\u2713 Pushed tag 1.2.0",
+            ],
+            ["\u2713 Pushed develop"],
+            id="no-develop-remote",
+        ),
+    ],
+)
+def test_finish_command_matrix(
+    mock_managers: SimpleNamespace,
+    runner: CliRunner,
+    develop_exists: bool,
+    has_remote: bool,
+    final_branch: str,
+    expected_refspecs,
+    expected,
+    not_expected,
+):
+    """Test the finish command across the develop-branch / remote matrix."""
+    git_mock = mock_managers.git
+    git_mock.get_current_branch_name.return_value = "release/1.2.0"
+    git_mock.branch_exists.side_effect = lambda name: (
+        develop_exists if name == "develop" else True
+    )
+    git_mock.has_remote.return_value = has_remote
+
+    result = runner.invoke(finish, input=YES)
+
+    assert result.exit_code == 0
+
+    # The merge/tag/cleanup sequence is identical in every variant
+    git_mock.merge_branch.assert_any_call("release/1.2.0", "Finish 1.2.0", no_ff=True)
+    git_mock.create_tag.assert_called_once_with("1.2.0")
+    git_mock.delete_branch.assert_called_once()
+
+    # Merge goes through main; the final checkout depends on develop
+    checkout_calls = git_mock.checkout_branch.call_args_list
+    assert ("main",) in [call[0] for call in checkout_calls]
+    assert checkout_calls[-1][0] == (final_branch,)
+
+    if expected_refspecs is None:
+        git_mock.push_refspecs.assert_not_called()
+    else:
+        git_mock.push_refspecs.assert_called_once_with(expected_refspecs)
+
+    assert_all_in(result.output, *expected)
+    for snippet in not_expected:
+        assert snippet not in result.output
+
+
+def test_finish_command_hotfix_branch_success(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test successful finish command execution for a hotfix branch."""
+    git_mock = mock_managers.git
+    git_mock.get_current_branch_name.return_value = "hotfix/1.2.0"
+
+    result = runner.invoke(finish, input=YES)
+
+    assert result.exit_code == 0
+    assert "Hotfix 1.2.0 finished successfully" in result.output
+    git_mock.checkout_branch.assert_any_call("main")
+    git_mock.merge_branch.assert_any_call("hotfix/1.2.0", "Finish 1.2.0", no_ff=True)
+    git_mock.create_tag.assert_called_once_with("1.2.0")
+    git_mock.delete_branch.assert_called_once_with(
+        "hotfix/1.2.0", force=False, delete_remote=False
+    )
+
+
+def test_finish_command_not_release_branch(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test finish command not on a managed branch."""
+    result = runner.invoke(finish)
+
+    assert result.exit_code == 1
+    assert "release or hotfix branch" in result.output
+
+
+def test_finish_command_dirty_working_directory(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test finish command with dirty working directory."""
+    mock_managers.git.is_working_directory_clean.return_value = False
+
+    result = runner.invoke(finish)
+
+    assert result.exit_code == 1
+    assert "uncommitted changes" in result.output
+
+
+def test_finish_command_cancel(mock_managers: SimpleNamespace, runner: CliRunner):
+    """Test finish command cancellation."""
+    git_mock = mock_managers.git
+    git_mock.get_current_branch_name.return_value = "release/1.2.0"
+
+    result = runner.invoke(finish, input=NO)
+
+    assert result.exit_code == 0
+    assert "Release finish cancelled" in result.output
+
+    # Should not perform any git operations
+    git_mock.merge_branch.assert_not_called()
+    git_mock.create_tag.assert_not_called()
+
+
+def test_finish_command_git_error(mock_managers: SimpleNamespace, runner: CliRunner):
+    """Test finish command with Git operation error."""
+    git_mock = mock_managers.git
+    git_mock.get_current_branch_name.return_value = "release/1.2.0"
+    git_mock.checkout_branch.side_effect = GitOperationError("Test error")
+
+    result = runner.invoke(finish, input=YES)
+
+    assert result.exit_code == 1
+    assert "Test error" in result.output
+
+
+@pytest.mark.slow
+def test_finish_command_push_failure_handling(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test finish command handles push failures gracefully."""
+    git_mock = mock_managers.git
+    git_mock.get_current_branch_name.return_value = "release/1.2.0"
+    git_mock.branch_exists.return_value = False
+    git_mock.has_remote.return_value = True
+    git_mock.push_refspecs.side_effect = GitOperationError("Push failed")
+
+    result = runner.invoke(finish, input=YES_YES)  # Yes to finish, Yes to push
+
+    assert result.exit_code == 0  # Should not fail despite push error
+    assert_all_in(
+        result.output,
+        "Failed to push some changes: Push failed",
+        "You may need to push manually",
+    )
+
+
+@pytest.mark.slow
+def test_finish_command_push_only_existing_branches(
+    mock_managers: SimpleNamespace, runner: CliRunner
+):
+    """Test finish command only pushes branches that exist."""
+    git_mock = mock_managers.git
+    git_mock.get_current_branch_name.return_value = "release/1.2.0"
+
+    def branch_exists_side_effect(branch_name):
+        return branch_name != "develop"  # Only main exists, no develop
+
+    git_mock.branch_exists.side_effect = branch_exists_side_effect
+    git_mock.has_remote.return_value = True
+
+    result = runner.invoke(finish, input=YES_YES)  # Yes to finish, Yes to push
+
+    assert result.exit_code == 0
+    assert "✓ Pushed main" in result.output
+    assert "✓ Pushed develop" not in result.output  # develop doesn't exist
+
+    # Verify only main was pushed, not develop
+    git_mock.push_refspecs.assert_called_once_with(["main", "refs/tags/*:refs/tags/*"])
+
+
+@pytest.fixture(scope="module")
+def vm_100() -> VersionManager:
+    """One VersionManager over a single 1.0.0 tag for the prompt tests.
+
+    _prompt_for_bump_type only reads from it, so the instance is safe
+    to share across the module.
+    """
+    return VersionManager(["1.0.0"])
+
+
+@pytest.mark.parametrize(
+    "reply,expected",
+    [
+        ("m", "minor"),
+        ("", "minor"),  # Enter accepts the minor default
+        ("p", "patch"),
+        ("M", "major"),
+        ("Patch", "patch"),  # Words stay case-insensitive
+        ("MAJOR", "major"),
+    ],
+    ids=["minor", "default", "patch", "major", "patch-word", "major-word"],
+)
+def test_prompt_for_bump_type(
+    vm_100: VersionManager,
+    monkeypatch: pytest.MonkeyPatch,
+    reply: str,
+    expected: str,
+):
+    """Test mapping each prompt reply to its bump type."""
+    monkeypatch.setattr(click, "prompt", lambda *a, **kw: reply)
+    assert _prompt_for_bump_type(vm_100) == expected
 
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_release_command_push_failure_handling(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test release command handles push failures gracefully."""
-        # Setup mocks
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.get_current_branch_name.return_value = "main"
-        git_mock.get_all_tags.return_value = ["1.0.0"]
-        git_mock.has_remote.return_value = True
-        git_mock.push_branch.side_effect = GitOperationError("Push failed")
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.suggest_version.return_value = Mock(__str__=lambda x: "1.1.0")
-        mock_version_manager.return_value = version_mock
-
-        runner = CliRunner()
-        result = runner.invoke(release, ["--minor"], input="y\n")
-
-        assert result.exit_code == 0  # Should not fail despite push error
-        assert "Failed to push release branch: Push failed" in result.output
-        assert "You may need to push manually" in result.output
-
-        # Verify push was attempted
-        git_mock.push_branch.assert_called_once_with("release/1.1.0", set_upstream=True)
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    @patch("grm.cli.VersionManager")
-    def test_hotfix_command_success(
-        self, mock_version_manager, mock_changelog_manager, mock_git_manager
-    ):
-        """Test successful hotfix command execution."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "develop"
-        git_mock.get_current_branch_name.return_value = "develop"
-        git_mock.get_all_tags.return_value = ["1.1.0"]
-        git_mock.has_remote.return_value = True
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        version_mock = Mock()
-        version_mock.suggest_version.return_value = Mock(__str__=lambda x: "1.2.0")
-        mock_version_manager.return_value = version_mock
-
-        runner = CliRunner()
-        result = runner.invoke(hotfix, ["--minor"], input="y\n")
-
-        assert result.exit_code == 0
-        assert "Hotfix branch 'hotfix/1.2.0' created successfully" in result.output
-        git_mock.create_branch.assert_called_once_with("hotfix/1.2.0", checkout=True)
-        changelog_mock.move_unreleased_to_version.assert_called_once_with("1.2.0")
-        git_mock.commit_changes.assert_called_once_with(
-            "Changelog", files=["CHANGELOG.md"]
-        )
-        git_mock.push_branch.assert_called_once_with("hotfix/1.2.0", set_upstream=True)
-
-    @patch("grm.cli.GitManager")
-    @patch("grm.cli.ChangelogManager")
-    def test_hotfix_command_stops_when_hotfix_branch_exists(
-        self, mock_changelog_manager, mock_git_manager
-    ):
-        """Test hotfix command stops when a hotfix branch already exists."""
-        git_mock = self._create_git_mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_release_source_branch.return_value = "develop"
-        git_mock.get_current_branch_name.return_value = "develop"
-        git_mock.has_remote.return_value = True
-        git_mock.get_version_branch_names.return_value = [
-            "hotfix/1.1.1",
-            "hotfix/1.1.2",
-        ]
-        mock_git_manager.return_value = git_mock
-
-        changelog_mock = Mock()
-        changelog_mock.changelog_exists.return_value = True
-        changelog_mock.validate_changelog_format.return_value = []
-        changelog_mock.has_unreleased_content.return_value = True
-        mock_changelog_manager.return_value = changelog_mock
-
-        runner = CliRunner()
-        result = runner.invoke(hotfix, ["--patch"])
-
-        assert result.exit_code == 1
-        assert "Existing hotfix branch found" in result.output
-        assert "hotfix/1.1.1, hotfix/1.1.2" in result.output
-        git_mock.get_version_branch_names.assert_called_once_with(
-            "hotfix", fetch_remote=True
-        )
-        git_mock.create_branch.assert_not_called()
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_success(self, mock_git_manager):
-        """Test successful finish command execution."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_integration_branch.return_value = "main"
-        git_mock.branch_exists.return_value = True
-        git_mock.has_remote.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")
-
-        assert result.exit_code == 0
-        assert "Release 1.2.0 finished successfully" in result.output
-
-        # Verify method calls
-        git_mock.checkout_branch.assert_any_call("main")
-        git_mock.merge_branch.assert_called()
-        git_mock.create_tag.assert_called_once_with("1.2.0")
-        git_mock.delete_branch.assert_called_once()
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_hotfix_branch_success(self, mock_git_manager):
-        """Test successful finish command execution for a hotfix branch."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "hotfix/1.2.0"
-        git_mock.get_integration_branch.return_value = "main"
-        git_mock.branch_exists.return_value = True
-        git_mock.has_remote.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")
-
-        assert result.exit_code == 0
-        assert "Hotfix 1.2.0 finished successfully" in result.output
-        git_mock.checkout_branch.assert_any_call("main")
-        git_mock.merge_branch.assert_any_call("hotfix/1.2.0", "Finish 1.2.0", no_ff=True)
-        git_mock.create_tag.assert_called_once_with("1.2.0")
-        git_mock.delete_branch.assert_called_once_with(
-            "hotfix/1.2.0", force=False, delete_remote=False
-        )
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_not_release_branch(self, mock_git_manager):
-        """Test finish command not on a managed branch."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "main"
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish)
-
-        assert result.exit_code == 1
-        assert "release or hotfix branch" in result.output
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_dirty_working_directory(self, mock_git_manager):
-        """Test finish command with dirty working directory."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish)
-
-        assert result.exit_code == 1
-        assert "uncommitted changes" in result.output
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_with_develop_branch(self, mock_git_manager):
-        """Test finish command with develop branch present."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.branch_exists.return_value = True  # develop branch exists
-        git_mock.has_remote.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")
-
-        assert result.exit_code == 0
-        assert "Merging back to develop" in result.output
-
-        # Should checkout develop and merge
-        git_mock.checkout_branch.assert_any_call("develop")
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_no_develop_branch(self, mock_git_manager):
-        """Test finish command without develop branch."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_release_source_branch.return_value = "main"
-
-        def branch_exists_side_effect(branch_name):
-            return branch_name != "develop"
-
-        git_mock.branch_exists.side_effect = branch_exists_side_effect
-        git_mock.has_remote.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")
-
-        assert result.exit_code == 0
-        assert "No 'develop' branch found" in result.output
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_cancel(self, mock_git_manager):
-        """Test finish command cancellation."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="n\n")
-
-        assert result.exit_code == 0
-        assert "Release finish cancelled" in result.output
-
-        # Should not perform any git operations
-        git_mock.merge_branch.assert_not_called()
-        git_mock.create_tag.assert_not_called()
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_git_error(self, mock_git_manager):
-        """Test finish command with Git operation error."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_release_source_branch.return_value = "main"
-        git_mock.checkout_branch.side_effect = GitOperationError("Test error")
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")
-
-        assert result.exit_code == 1
-        assert "Test error" in result.output
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_checkout_to_develop_after_completion(
-        self, mock_git_manager
-    ):
-        """Test that finish command checks out to develop branch after completion."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_integration_branch.return_value = "main"
-        git_mock.branch_exists.return_value = True  # develop branch exists
-        git_mock.has_remote.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")
-
-        assert result.exit_code == 0
-
-        # Verify checkout calls - should checkout develop at the end
-        checkout_calls = git_mock.checkout_branch.call_args_list
-        assert ("main",) in [
-            call[0] for call in checkout_calls
-        ]  # Checkout main for merge
-        assert ("develop",) in [
-            call[0] for call in checkout_calls
-        ]  # Merge back to develop
-        assert checkout_calls[-1][0] == ("develop",)  # Final checkout should be develop
-        assert "✓ Switched to develop branch" in result.output
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_checkout_to_integration_when_no_develop(
-        self, mock_git_manager
-    ):
-        """Test that finish command checks out to integration branch when no develop exists."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_integration_branch.return_value = "main"
-
-        def branch_exists_side_effect(branch_name):
-            return branch_name != "develop"  # develop doesn't exist
-
-        git_mock.branch_exists.side_effect = branch_exists_side_effect
-        git_mock.has_remote.return_value = False
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")
-
-        assert result.exit_code == 0
-
-        # Verify final checkout is to main (integration branch)
-        checkout_calls = git_mock.checkout_branch.call_args_list
-        assert checkout_calls[-1][0] == ("main",)  # Final checkout should be main
-        assert "✓ Switched to main branch" in result.output
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_auto_push_with_remote(self, mock_git_manager):
-        """Test finish command automatically pushes when remote exists."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_integration_branch.return_value = "main"
-        git_mock.branch_exists.return_value = True  # develop exists
-        git_mock.has_remote.return_value = True
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")  # Yes to finish
-
-        assert result.exit_code == 0
-        assert "Pushing changes to remote..." in result.output
-        assert "✓ Pushed main" in result.output
-        assert "✓ Pushed tag 1.2.0" in result.output
-        assert "✓ Pushed develop" in result.output
-
-        # Verify push operations
-        git_mock.push_branch.assert_any_call("main")
-        git_mock.push_branch.assert_any_call("develop")
-        git_mock.repo.git.push.assert_called_with("origin", "--tags")
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_auto_push_no_develop(self, mock_git_manager):
-        """Test finish command automatically pushes without develop branch."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_integration_branch.return_value = "main"
-        git_mock.branch_exists.return_value = False  # no develop
-        git_mock.has_remote.return_value = True
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")  # Yes to finish
-
-        assert result.exit_code == 0
-        assert "Pushing changes to remote..." in result.output
-        assert "✓ Pushed main" in result.output
-        assert "✓ Pushed tag 1.2.0" in result.output
-
-        # Verify push operations - develop should not be pushed
-        git_mock.push_branch.assert_called_once_with("main")
-        git_mock.repo.git.push.assert_called_with("origin", "--tags")
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_no_push_prompt_without_remote(self, mock_git_manager):
-        """Test finish command doesn't prompt for push when no remote exists."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_integration_branch.return_value = "main"
-        git_mock.branch_exists.return_value = False
-        git_mock.has_remote.return_value = False  # No remote
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\n")  # Only yes to finish
-
-        assert result.exit_code == 0
-        assert "Push all changes to remote?" not in result.output
-        assert "Pushing changes to remote..." not in result.output
-
-        # Verify no push operations occurred
-        git_mock.push_branch.assert_not_called()
 
-    @patch("grm.cli.GitManager")
-    def test_finish_command_push_failure_handling(self, mock_git_manager):
-        """Test finish command handles push failures gracefully."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_integration_branch.return_value = "main"
-        git_mock.branch_exists.return_value = False
-        git_mock.has_remote.return_value = True
-        git_mock.push_branch.side_effect = GitOperationError("Push failed")
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\ny\n")  # Yes to finish, Yes to push
-
-        assert result.exit_code == 0  # Should not fail despite push error
-        assert "Failed to push some changes: Push failed" in result.output
-        assert "You may need to push manually" in result.output
-
-    @patch("grm.cli.GitManager")
-    def test_finish_command_push_only_existing_branches(self, mock_git_manager):
-        """Test finish command only pushes branches that exist."""
-        git_mock = Mock()
-        git_mock.is_working_directory_clean.return_value = True
-        git_mock.get_current_branch_name.return_value = "release/1.2.0"
-        git_mock.get_integration_branch.return_value = "main"
-
-        def branch_exists_side_effect(branch_name):
-            return branch_name != "develop"  # Only main exists, no develop
-
-        git_mock.branch_exists.side_effect = branch_exists_side_effect
-        git_mock.has_remote.return_value = True
-        mock_git_manager.return_value = git_mock
-
-        runner = CliRunner()
-        result = runner.invoke(finish, input="y\ny\n")  # Yes to finish, Yes to push
-
-        assert result.exit_code == 0
-        assert "✓ Pushed main" in result.output
-        assert "✓ Pushed develop" not in result.output  # develop doesn't exist
-
-        # Verify only main was pushed, not develop
-        git_mock.push_branch.assert_called_once_with("main")
-
-    def test_prompt_for_bump_type_minor(self):
-        """Test prompting for bump type - minor selected."""
-        from grm.cli import _prompt_for_bump_type
-        from grm.version_manager import VersionManager
-
-        version_manager = VersionManager(["1.0.0"])
-
-        with patch("click.prompt", return_value="m"):
-            result = _prompt_for_bump_type(version_manager)
-            assert result == "minor"
-
-    def test_prompt_for_bump_type_default(self):
-        """Test prompting for bump type - default (Enter) selects minor."""
-        from grm.cli import _prompt_for_bump_type
-        from grm.version_manager import VersionManager
-
-        version_manager = VersionManager(["1.0.0"])
-
-        # Empty string simulates pressing Enter with default value
-        with patch("click.prompt", return_value=""):
-            result = _prompt_for_bump_type(version_manager)
-            assert result == "minor"
-
-    def test_prompt_for_bump_type_patch(self):
-        """Test prompting for bump type - patch selected."""
-        from grm.cli import _prompt_for_bump_type
-        from grm.version_manager import VersionManager
-
-        version_manager = VersionManager(["1.0.0"])
-
-        with patch("click.prompt", return_value="p"):
-            result = _prompt_for_bump_type(version_manager)
-            assert result == "patch"
-
-    def test_prompt_for_bump_type_invalid_then_valid(self):
-        """Test prompting for bump type with invalid then valid input."""
-        from grm.cli import _prompt_for_bump_type
-        from grm.version_manager import VersionManager
-
-        version_manager = VersionManager(["1.0.0"])
-
-        with patch("click.prompt", side_effect=["invalid", "x", "m"]):
-            result = _prompt_for_bump_type(version_manager)
-            assert result == "minor"
-
-    def test_prompt_for_bump_type_major(self):
-        """Test prompting for bump type - major selected."""
-        from grm.cli import _prompt_for_bump_type
-        from grm.version_manager import VersionManager
-
-        version_manager = VersionManager(["1.0.0"])
-
-        with patch("click.prompt", return_value="M"):
-            result = _prompt_for_bump_type(version_manager)
-            assert result == "major"
+def test_prompt_for_bump_type_invalid_then_valid(
+    vm_100: VersionManager, runner: CliRunner
+):
+    """Test invalid input is re-prompted by click's choice validation."""
+
+    @click.command()
+    def prompt_cmd():
+        click.echo(_prompt_for_bump_type(vm_100))
+
+    result = runner.invoke(prompt_cmd, input=answers("invalid", "x", "m"))
+
+    assert result.exit_code == 0
+    assert result.output.rstrip().endswith("minor")
@@ -4,7 +4,10 @@ import os
 import pytest
 from unittest.mock import Mock, patch
 
+from git import Repo
+
 from grm.git_operations import GitManager, GitOperationError
+from tests.conftest import fastwrite
 
 
 class TestGitManager:
@@ -23,39 +26,28 @@ class TestGitManager:
         with pytest.raises(GitOperationError, match="not a valid Git repository"):
             GitManager(non_git_dir)
 
-    def test_init_with_subdirectory(self, git_manager: GitManager):
-        """Test GitManager initialization from a subdirectory of a Git repository."""
-        # Create a subdirectory in the repository
-        sub_dir = os.path.join(git_manager.repo.working_dir, "subdir", "nested")
-        os.makedirs(sub_dir)
+    @pytest.mark.parametrize(
+        "relative_path",
+        [
+            os.path.join("subdir", "nested"),
+            os.path.join("level1", "level2", "level3", "level4"),
+        ],
+        ids=["subdirectory", "deep_subdirectory"],
+    )
+    def test_init_from_subdirectory(self, git_manager: GitManager, relative_path: str):
+        """Test GitManager discovers the root repo from nested subdirectories."""
+        # The template repo ships these subdirectory trees pre-made
+        sub_dir = os.path.join(git_manager.repo.working_dir, relative_path)
 
-        # Initialize GitManager from the subdirectory
         manager_from_subdir = GitManager(sub_dir)
 
-        # Should find the parent repository
+        # Should find the parent repository regardless of nesting depth
         assert manager_from_subdir.repo is not None
         assert manager_from_subdir.repo.working_dir == git_manager.repo.working_dir
 
-    def test_init_with_deep_subdirectory(self, git_manager: GitManager):
-        """Test GitManager initialization from a deeply nested subdirectory."""
-        # Create a deeply nested subdirectory structure
-        deep_dir = os.path.join(
-            git_manager.repo.working_dir, "level1", "level2", "level3", "level4"
-        )
-        os.makedirs(deep_dir)
-
-        # Initialize GitManager from the deep subdirectory
-        manager_from_deep = GitManager(deep_dir)
-
-        # Should still find the root repository
-        assert manager_from_deep.repo is not None
-        assert manager_from_deep.repo.working_dir == git_manager.repo.working_dir
-
     def test_init_subdirectory_operations(self, git_manager: GitManager):
         """Test that operations work correctly when initialized from a subdirectory."""
-        # Create a subdirectory
         sub_dir = os.path.join(git_manager.repo.working_dir, "src")
-        os.makedirs(sub_dir)
 
         # Initialize GitManager from subdirectory
         manager_from_subdir = GitManager(sub_dir)
@@ -66,8 +58,7 @@ class TestGitManager:
 
         # Create a file in the subdirectory
         test_file = os.path.join(sub_dir, "test.txt")
-        with open(test_file, "w") as f:
-            f.write("test")
+        fastwrite(test_file, "test")
 
         # Working directory should now be dirty
         assert manager_from_subdir.is_working_directory_clean() is False
@@ -80,28 +71,32 @@ class TestGitManager:
         """Test working directory status when dirty."""
         # Create an untracked file
         test_file = os.path.join(git_manager.repo.working_dir, "untracked.txt")
-        with open(test_file, "w") as f:
-            f.write("untracked content")
+        fastwrite(test_file, "untracked content")
 
         assert git_manager.is_working_directory_clean() is False
 
-    def test_get_integration_branch_main_exists(self, git_manager: GitManager):
-        """Test integration branch detection when main exists."""
-        # The fixture creates a 'main' branch by default
-        assert git_manager.get_integration_branch() == "main"
-
-    def test_get_integration_branch_master_only(self, git_manager: GitManager):
-        """Test integration branch detection when only master exists."""
-        # Rename main to master
-        git_manager.repo.heads.main.rename("master")
-        assert git_manager.get_integration_branch() == "master"
-
-    def test_get_integration_branch_both_exist(self, git_manager: GitManager):
-        """Test integration branch detection when both main and master exist."""
-        # Create master branch
-        git_manager.repo.create_head("master")
-        # Should prefer main
-        assert git_manager.get_integration_branch() == "main"
+    @pytest.mark.parametrize(
+        "setup,expected",
+        [
+            pytest.param(lambda repo: None, "main", id="main_exists"),
+            pytest.param(
+                lambda repo: repo.heads.main.rename("master"),
+                "master",
+                id="master_only",
+            ),
+            pytest.param(
+                lambda repo: repo.create_head("master"),
+                "main",
+                id="both_prefer_main",
+            ),
+        ],
+    )
+    def test_get_integration_branch(
+        self, git_manager: GitManager, setup, expected: str
+    ):
+        """Test integration branch detection across branch layouts."""
+        setup(git_manager.repo)
+        assert git_manager.get_integration_branch() == expected
 
     def test_get_integration_branch_neither_exists(self, git_manager: GitManager):
         """Test integration branch detection when neither exists."""
@@ -113,16 +108,31 @@ class TestGitManager:
         ):
             git_manager.get_integration_branch()
 
-    def test_get_release_source_branch_develop_exists(self, git_manager: GitManager):
-        """Test release source branch detection when develop exists."""
-        # Create develop branch
-        git_manager.repo.create_head("develop")
-        assert git_manager.get_release_source_branch() == "develop"
-
-    def test_get_release_source_branch_no_develop(self, git_manager: GitManager):
-        """Test release source branch detection when develop doesn't exist."""
-        # Should return integration branch (main)
-        assert git_manager.get_release_source_branch() == "main"
+    @pytest.mark.parametrize(
+        "setup,expected",
+        [
+            pytest.param(
+                lambda repo: repo.create_head("develop"),
+                "develop",
+                id="develop_exists",
+            ),
+            pytest.param(lambda repo: None, "main", id="no_develop"),
+            pytest.param(
+                lambda repo: (
+                    repo.heads.main.rename("master"),
+                    repo.create_head("develop"),
+                ),
+                "develop",
+                id="develop_and_master",
+            ),
+        ],
+    )
+    def test_get_release_source_branch(
+        self, git_manager: GitManager, setup, expected: str
+    ):
+        """Test release source branch detection across branch layouts."""
+        setup(git_manager.repo)
+        assert git_manager.get_release_source_branch() == expected
 
     def test_get_release_branch_names_includes_local_and_remote(
         self, git_manager: GitManager
@@ -164,15 +174,6 @@ class TestGitManager:
         assert hotfix_branches == ["hotfix/1.1.1", "hotfix/1.1.2"]
         mock_remote.return_value.fetch.assert_called_once_with()
 
-    def test_get_release_source_branch_develop_and_master(
-        self, git_manager: GitManager
-    ):
-        """Test release source branch when develop exists but main doesn't."""
-        # Rename main to master and create develop
-        git_manager.repo.heads.main.rename("master")
-        git_manager.repo.create_head("develop")
-        assert git_manager.get_release_source_branch() == "develop"
-
     def test_get_all_tags(self, repo_with_tags: GitManager):
         """Test getting all tags from repository."""
         tags = repo_with_tags.get_all_tags()
@@ -238,8 +239,7 @@ class TestGitManager:
         """Test committing changes."""
         # Create a file to commit
         test_file = os.path.join(git_manager.repo.working_dir, "test.txt")
-        with open(test_file, "w") as f:
-            f.write("test content")
+        fastwrite(test_file, "test content")
 
         git_manager.commit_changes("Test commit", files=["test.txt"])
 
@@ -254,8 +254,7 @@ class TestGitManager:
         git_manager.create_branch(feature_branch, checkout=True)
 
         test_file = os.path.join(git_manager.repo.working_dir, "feature.txt")
-        with open(test_file, "w") as f:
-            f.write("feature content")
+        fastwrite(test_file, "feature content")
 
         git_manager.commit_changes("Feature commit", files=["feature.txt"])
 
@@ -304,8 +303,7 @@ class TestGitManager:
 
         # Make a commit on the branch
         test_file = os.path.join(git_manager.repo.working_dir, "branch.txt")
-        with open(test_file, "w") as f:
-            f.write("branch content")
+        fastwrite(test_file, "branch content")
         git_manager.commit_changes("Branch commit", files=["branch.txt"])
 
         # Switch back to main
@@ -320,54 +318,90 @@ class TestGitManager:
         assert git_manager.branch_exists("main") is True
         assert git_manager.branch_exists("nonexistent") is False
 
+    def test_snapshot_repo_state(self, git_manager: GitManager):
+        """Test capturing repository state with one ref listing."""
+        git_manager.create_branch("develop", checkout=False)
+        git_manager.create_tag("1.0.0")
+
+        state = git_manager.snapshot_repo_state()
+
+        assert "main" in state.local_branches
+        assert "develop" in state.local_branches
+        assert "1.0.0" in state.tags
+        assert state.has_remote is False
+        assert state.current_branch == "main"
+
     def test_get_branch_commit_count(self, git_manager: GitManager):
         """Test getting commit count between branches."""
         # Create feature branch with commits
         feature_branch = "feature"
         git_manager.create_branch(feature_branch, checkout=True)
 
-        # Make 2 commits
+        # Make 2 commits straight through the index; commit_changes has
+        # its own test and each index.commit skips a git subprocess here
+        index = git_manager.repo.index
         for i in range(2):
             test_file = os.path.join(git_manager.repo.working_dir, f"test{i}.txt")
-            with open(test_file, "w") as f:
-                f.write(f"content {i}")
-            git_manager.commit_changes(f"Commit {i}", files=[f"test{i}.txt"])
+            fastwrite(test_file, f"content {i}")
+            index.add([f"test{i}.txt"])
+            index.commit(f"Commit {i}")
 
         count = git_manager.get_branch_commit_count("feature", "main")
         assert count == 2
 
-    def test_push_branch(self, git_manager: GitManager):
-        """Test pushing a branch (mocked)."""
-        with patch("grm.git_operations.GitManager.push_branch") as mock_push:
-            manager = GitManager(git_manager.repo.working_dir)
-            manager.push_branch("main")
-            mock_push.assert_called_once_with("main")
+    def test_push_many_aggregates_failures(self, git_manager: GitManager):
+        """Test concurrent pushes run for every ref and aggregate failures."""
 
-    def test_push_branch_with_upstream(self, git_manager: GitManager):
-        """Test pushing a branch with upstream (mocked)."""
-        with patch("grm.git_operations.GitManager.push_branch") as mock_push:
-            manager = GitManager(git_manager.repo.working_dir)
-            manager.push_branch("main", set_upstream=True)
-            mock_push.assert_called_once_with("main", set_upstream=True)
+        def push(ref):
+            if ref == "bad":
+                raise GitOperationError(f"Failed to push branch '{ref}': boom")
+
+        with patch.object(git_manager, "push_branch", side_effect=push) as mock_push:
+            with pytest.raises(GitOperationError) as exc_info:
+                git_manager.push_many(["main", "bad"])
+
+        assert mock_push.call_count == 2
+        assert "bad" in str(exc_info.value)
+
+    def test_push_branch(self, git_manager: GitManager, bare_remote: str):
+        """Test pushing a branch to a local bare remote."""
+        git_manager.repo.create_remote("origin", bare_remote)
+
+        git_manager.push_branch("main")
+
+        remote_repo = Repo(bare_remote)
+        assert remote_repo.commit("main").hexsha == git_manager.repo.head.commit.hexsha
+
+    def test_push_branch_with_upstream(self, git_manager: GitManager, bare_remote: str):
+        """Test pushing a branch with upstream tracking."""
+        git_manager.repo.create_remote("origin", bare_remote)
+
+        git_manager.push_branch("main", set_upstream=True)
+
+        remote_repo = Repo(bare_remote)
+        assert remote_repo.commit("main").hexsha == git_manager.repo.head.commit.hexsha
+        tracking = git_manager.repo.heads.main.tracking_branch()
+        assert tracking is not None
+        assert tracking.name == "origin/main"
 
     def test_has_remote_false(self, git_manager: GitManager):
         """Test has_remote when no remote exists."""
         assert git_manager.has_remote() is False
 
-    def test_has_remote_true(self, git_manager: GitManager):
-        """Test has_remote when remote exists (mocked)."""
-        with patch("grm.git_operations.GitManager.has_remote", return_value=True):
-            manager = GitManager(git_manager.repo.working_dir)
-            assert manager.has_remote() is True
+    def test_has_remote_true(self, git_manager: GitManager, bare_remote: str):
+        """Test has_remote when a remote is configured."""
+        git_manager.repo.create_remote("origin", bare_remote)
+
+        assert git_manager.has_remote() is True
 
     def test_get_integration_branch_no_remote(self, git_manager: GitManager):
         """Test integration branch when no remote and no local main/master."""
         # Rename main to something else
         git_manager.repo.heads.main.rename("develop")
-        
+
         # Ensure no remote
         assert git_manager.has_remote() is False
-        
+
         # Should raise error since no remote to fall back to
         with pytest.raises(
             GitOperationError, match="Neither 'main' nor 'master' branch found"
@@ -377,14 +411,14 @@ class TestGitManager:
     def test_get_release_source_branch_no_remote_develop(self, git_manager: GitManager):
         """Test release source branch when no origin/develop, falls back to integration."""
         # Mock remote without develop
-        with patch.object(git_manager, 'has_remote', return_value=True):
-            with patch.object(git_manager.repo, 'remote') as mock_remote:
+        with patch.object(git_manager, "has_remote", return_value=True):
+            with patch.object(git_manager.repo, "remote") as mock_remote:
                 # Create mock references without develop
                 mock_ref = Mock()
                 mock_ref.name = "origin/main"
                 mock_remote.return_value.refs = [mock_ref]
-                
+
                 result = git_manager.get_release_source_branch()
-                
+
                 # Should fall back to integration branch (main)
                 assert result == "main"
@@ -90,7 +90,7 @@ class TestVersionManager:
     def test_init_with_empty_tags(self):
         """Test VersionManager initialization with no tags."""
         manager = VersionManager([])
-        assert manager.get_all_versions() == []
+        assert manager.get_all_versions() == ()
         assert manager.get_latest_version() is None
 
     def test_init_with_semver_tags(self):